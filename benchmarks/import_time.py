@@ -0,0 +1,56 @@
+"""Guard the import cost of the packages used by CLIs and short-lived workers.
+
+Runs ``python -X importtime`` in a fresh interpreter, reports the cumulative
+import time of each package, and exits non-zero when a package exceeds its
+budget or pulls in an SDK that should only load once a client is built.
+
+    python benchmarks/import_time.py [--budget-ms 150]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict
+
+PACKAGES = ["gen_fix_cycle", "sheets"]
+DEFERRED = ["anthropic", "httpx", "googleapiclient"]
+BUDGET_MS = 150.0
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+def import_times(module: str) -> Dict[str, int]:
+    """Return cumulative import time in microseconds for every module loaded."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": SRC}
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=BUDGET_MS)
+    args = parser.parse_args()
+
+    failed = False
+    for package in PACKAGES:
+        times = import_times(package)
+        elapsed = times[package] / 1000
+        eager = [name for name in DEFERRED if name in times]
+        over = elapsed > args.budget_ms
+        failed = failed or over or bool(eager)
+        print(f"{package}: {elapsed:.1f} ms (budget {args.budget_ms:.0f} ms)"
+              + (" OVER BUDGET" if over else "")
+              + (f"; eagerly imports {', '.join(eager)}" if eager else ""))
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,52 @@
+"""Compare prompt render cost: string.Template substitution vs the prompt registry.
+
+Renders the generation prompts (article prefix with subject criteria plus the
+per-question part) and a short QC prompt for 10k questions both ways, and
+reports the time per prompt.
+
+    python benchmarks/render_prompts.py [--count 10000]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from gen_fix_cycle.prompts.criteria import SubjectCriteria  # noqa: E402
+from gen_fix_cycle.prompts.gen_prompts import GenerationPrompts  # noqa: E402
+from gen_fix_cycle.prompts.qc_prompts import QualityCheckPrompts  # noqa: E402
+from gen_fix_cycle.prompts.registry import PROMPTS  # noqa: E402
+
+ARTICLE = "A paragraph of article text about population geography. " * 400
+VALUES = dict(ek_codes="EK 1.A, EK 1.B", lo_codes="LO 1", difficulty="analyze", existing="")
+QC_VALUES = dict(question="Which factor best explains X?", responses="1. A\n2. B\n3. C\n4. D")
+
+def substitute(count: int) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        criteria = SubjectCriteria.MAPPING["soc"]["question"]
+        GenerationPrompts.MCQ_PREFIX.substitute(article=ARTICLE, criteria=criteria)
+        GenerationPrompts.MCQ.substitute(**VALUES)
+        QualityCheckPrompts.CLARITY.substitute(**QC_VALUES)
+    return time.perf_counter() - start
+
+def registry(count: int) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        PROMPTS.render("gen.mcq_prefix", "soc", article=ARTICLE)
+        PROMPTS.render("gen.mcq", **VALUES)
+        PROMPTS.render("qc.clarity", **QC_VALUES)
+    return time.perf_counter() - start
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=10000)
+    args = parser.parse_args()
+    for name, run in (("string.Template", substitute), ("registry", registry)):
+        elapsed = run(args.count)
+        print(f"{name:>16}: {elapsed:.3f} s for {args.count} questions ({elapsed / args.count * 1e6:.1f} us each)")
+
+if __name__ == "__main__":
+    main()
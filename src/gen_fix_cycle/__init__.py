@@ -8,6 +8,8 @@ Package Structure:
     config.py - Configuration and constants
     models.py - Data models and structures
     cycle.py - Main orchestration logic
+    batch.py - Concurrent batch runs over many cycle configs
+    dedup.py - Near-duplicate detection across the question bank
     prompts/ - Prompt templates and generation
         base.py - Base prompt templates
         criteria.py - Subject-specific criteria
@@ -28,6 +30,7 @@ Example:
     result = run_generation(config)
 """
 
+from .batch import BatchResult, run_generation_batch
 from .cycle import CycleConfig, run_generation
 from .models import (
     Question,
@@ -41,6 +44,8 @@ from .models import (
 __all__ = [
     'CycleConfig',
     'run_generation',
+    'run_generation_batch',
+    'BatchResult',
     'Question',
     'QuestionType',
     'Difficulty',
@@ -0,0 +1,117 @@
+"""Article preparation: normalization, chunking and relevance-ranked excerpts."""
+
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+import math
+import re
+import unicodedata
+from typing import Dict, List, Tuple
+
+from .usage import estimate_tokens
+
+TERM_RE = re.compile(r"[a-z0-9]+")
+SENTENCE_RE = re.compile(r"(?<=[.!?])\s+")
+PARAGRAPH_RE = re.compile(r"\n\s*\n")
+
+def normalize(text: str) -> str:
+    """Unicode-normalize and collapse whitespace, keeping paragraph breaks."""
+    text = unicodedata.normalize("NFKC", text).replace("\r\n", "\n")
+    paragraphs = (" ".join(p.split()) for p in PARAGRAPH_RE.split(text))
+    return "\n\n".join(p for p in paragraphs if p)
+
+def terms(text: str) -> List[str]:
+    return TERM_RE.findall(text.lower())
+
+def truncate(text: str, max_tokens: int) -> str:
+    """Cut ``text`` to at most ``max_tokens``, at a word boundary where possible."""
+    limit = max(4 * max_tokens - 1, 1)
+    if len(text) <= limit:
+        return text
+    head = text[:limit]
+    return head.rsplit(None, 1)[0] if " " in head.strip() else head
+
+def chunk(text: str, max_tokens: int = 200) -> List[str]:
+    """Split normalized text into paragraphs of at most ``max_tokens``.
+
+    Short neighbouring paragraphs are merged and long ones are split on
+    sentence boundaries.
+    """
+    pieces: List[str] = []
+    for paragraph in text.split("\n\n"):
+        if estimate_tokens(paragraph) <= max_tokens:
+            pieces.append(paragraph)
+        else:
+            pieces.extend(SENTENCE_RE.split(paragraph))
+
+    chunks: List[str] = []
+    for piece in pieces:
+        if chunks and estimate_tokens(chunks[-1]) + estimate_tokens(piece) <= max_tokens:
+            chunks[-1] += "\n\n" + piece
+        else:
+            chunks.append(piece)
+    return chunks
+
+@dataclass(frozen=True)
+class PreparedArticle:
+    """An article split into chunks with the term statistics BM25 needs."""
+    text: str
+    tokens: int
+    chunks: Tuple[str, ...]
+    chunk_terms: Tuple[Dict[str, int], ...]
+    document_frequency: Dict[str, int]
+    average_length: float
+
+    def rank(self, query: str, k1: float = 1.5, b: float = 0.75) -> List[int]:
+        """Chunk indexes ordered by BM25 score against ``query``."""
+        count = len(self.chunks)
+        query_terms = set(terms(query))
+        scores = []
+        for i, tf in enumerate(self.chunk_terms):
+            length = sum(tf.values())
+            score = 0.0
+            for term in query_terms & tf.keys():
+                df = self.document_frequency[term]
+                idf = math.log(1 + (count - df + 0.5) / (df + 0.5))
+                norm = k1 * (1 - b + b * length / (self.average_length or 1))
+                score += idf * tf[term] * (k1 + 1) / (tf[term] + norm)
+            scores.append(score)
+        return sorted(range(count), key=lambda i: scores[i], reverse=True)
+
+    def excerpt(self, query: str, budget: int) -> str:
+        """The most relevant chunks within ``budget`` tokens, in article order.
+
+        When even the top-ranked chunk is over budget, it is cut to fit
+        rather than returning an empty excerpt.
+        """
+        if self.tokens <= budget or not self.chunks:
+            return self.text
+        ranked = self.rank(query)
+        chosen: List[int] = []
+        used = 0
+        for i in ranked:
+            size = estimate_tokens(self.chunks[i])
+            if used + size <= budget:
+                chosen.append(i)
+                used += size
+        if not chosen:
+            return truncate(self.chunks[ranked[0]], budget)
+        return "\n\n".join(self.chunks[i] for i in sorted(chosen))
+
+@lru_cache(maxsize=64)
+def prepare_article(article: str) -> PreparedArticle:
+    """Normalize, chunk and index an article; repeated calls are memoized."""
+    text = normalize(article)
+    chunks = tuple(chunk(text))
+    chunk_terms = tuple(dict(Counter(terms(c))) for c in chunks)
+    document_frequency: Counter = Counter()
+    for tf in chunk_terms:
+        document_frequency.update(tf.keys())
+    return PreparedArticle(
+        text=text,
+        tokens=estimate_tokens(text),
+        chunks=chunks,
+        chunk_terms=chunk_terms,
+        document_frequency=dict(document_frequency),
+        average_length=sum(sum(tf.values()) for tf in chunk_terms) / max(1, len(chunks))
+    )
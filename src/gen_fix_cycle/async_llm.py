@@ -0,0 +1,143 @@
+"""Asyncio LLM client sharing one connection pool across cycles."""
+
+import asyncio
+import os
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from .cache import ResponseCache, cache_key
+from .config import LLMConfig
+from .llm import parse_json_text, request_params, response_text
+from .llm_prompts import (
+    SYSTEM_PROMPT,
+    fix_prompt,
+    generation_prefix,
+    generation_prompt,
+    quality_check_prompt,
+    repair_prompt
+)
+from .usage import UsageStats
+
+if TYPE_CHECKING:
+    import anthropic
+
+_shared_client: Optional["anthropic.AsyncAnthropic"] = None
+
+def shared_async_client(max_connections: int = 100) -> "anthropic.AsyncAnthropic":
+    """Return the process-wide async Anthropic client.
+
+    The first call creates the pooled transport; later calls reuse it and
+    ignore ``max_connections``.
+    """
+    global _shared_client
+    if _shared_client is None:
+        import anthropic
+        import httpx
+        _shared_client = anthropic.AsyncAnthropic(
+            api_key=os.getenv("ANTHROPIC_API_KEY"),
+            http_client=httpx.AsyncClient(limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections
+            ))
+        )
+    return _shared_client
+
+class AsyncLLMClient:
+    """Async counterpart of LLMClient with a bounded number of in-flight calls.
+
+    One instance is meant to be shared by every cycle on an event loop; use
+    ``with_config`` for cycles that need different LLM settings but the same
+    transport and in-flight limit. ``client`` may be any object exposing an
+    awaitable ``messages.create``, which is how tests inject a fake transport.
+    """
+
+    def __init__(
+        self,
+        config: LLMConfig,
+        client: Optional[Any] = None,
+        max_in_flight: int = 16,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        cache: Optional[ResponseCache] = None,
+        usage: Optional[UsageStats] = None
+    ):
+        self.config = config
+        self.client = client or shared_async_client()
+        self.max_in_flight = max_in_flight
+        self.semaphore = semaphore or asyncio.Semaphore(max_in_flight)
+        self.cache = cache
+        self.usage = usage or UsageStats()
+
+    def with_config(self, config: LLMConfig) -> "AsyncLLMClient":
+        """Return a client with other settings sharing this transport and limit."""
+        return AsyncLLMClient(
+            config, self.client, self.max_in_flight, self.semaphore, self.cache, self.usage
+        )
+
+    async def complete(
+        self,
+        prompt: str,
+        prefix: Optional[str] = None,
+        schema: Optional[Any] = None
+    ) -> Dict[str, Any]:
+        """Send prompt to Claude and parse JSON response, as LLMClient.complete."""
+        if not self.cache:
+            return await self._send(prompt, prefix, schema)
+
+        key = cache_key(self.config, SYSTEM_PROMPT, prompt, prefix or "")
+        result = self.cache.get(key)
+        if result is None:
+            result = await self._send(prompt, prefix, schema)
+            self.cache.put(key, result)
+        return result
+
+    async def _send(self, prompt: str, prefix: Optional[str], schema: Optional[Any]) -> Dict[str, Any]:
+        text = await self._request_text(request_params(self.config, prompt, prefix))
+        data = parse_json_text(text, schema)
+        if data is not None:
+            return data
+
+        repaired = await self._request_text(request_params(self.config, repair_prompt(text, schema)))
+        data = parse_json_text(repaired, schema)
+        if data is None:
+            raise ValueError("Failed to parse LLM response as JSON, even after a repair request")
+        return data
+
+    async def _request_text(self, params: Dict[str, Any]) -> str:
+        async with self.semaphore:
+            response = await self.client.messages.create(**params)
+        self.usage.add(response.usage)
+        return response_text(response)
+
+    async def generate_question(
+        self,
+        article: str,
+        ek_codes: Optional[str],
+        lo_codes: Optional[str],
+        criteria: str,
+        difficulty: str,
+        existing_questions: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Generate a new question."""
+        return await self.complete(
+            generation_prompt(ek_codes, lo_codes, difficulty, existing_questions),
+            prefix=generation_prefix(article, criteria)
+        )
+
+    async def quality_check(
+        self,
+        question: str,
+        responses: str,
+        check_type: str,
+        criteria: str
+    ) -> Dict[str, Any]:
+        """Run a quality check on a question."""
+        return await self.complete(quality_check_prompt(question, responses, check_type, criteria))
+
+    async def fix_question(
+        self,
+        question: str,
+        responses: str,
+        feedback: str,
+        fix_type: str
+    ) -> Dict[str, Any]:
+        """Fix issues in a question based on QC feedback."""
+        return await self.complete(fix_prompt(question, responses, feedback, fix_type))
@@ -0,0 +1,97 @@
+"""Batch execution of many generation cycles on a worker pool."""
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, replace
+from itertools import islice
+import logging
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+from .config import LLMConfig
+from .cycle import CycleConfig, GenerationCycleManager, config_key
+from .dedup import DedupIndex
+from .journal import CycleJournal
+from .llm import LLMClient
+from .models import GenerationCycle
+from .ratelimit import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class BatchResult:
+    """Outcome of one configuration in a batch run."""
+    index: int
+    config: CycleConfig
+    cycle: Optional[GenerationCycle] = None
+    error: Optional[str] = None
+
+def _run_one(
+    config: CycleConfig,
+    shared: LLMClient,
+    journal: Optional[CycleJournal],
+    dedup: Optional[DedupIndex]
+) -> GenerationCycle:
+    llm = shared.with_config(config.llm_config)
+    return GenerationCycleManager(config, llm, journal, dedup).run_cycle()
+
+def _with_cycle_id(index: int, config: CycleConfig) -> CycleConfig:
+    if config.cycle_id:
+        return config
+    return replace(config, cycle_id=f"{index}-{config_key(config)}")
+
+def _collect(index: int, config: CycleConfig, future: "Future[GenerationCycle]") -> BatchResult:
+    error = future.exception()
+    if error:
+        logger.error(f"Cycle {index} ({config.course}) failed: {error}")
+        return BatchResult(index=index, config=config, error=str(error))
+    return BatchResult(index=index, config=config, cycle=future.result())
+
+def run_generation_batch(
+    configs: Iterable[CycleConfig],
+    max_workers: int = 8,
+    rate_limit: Optional[float] = None,
+    llm: Optional[LLMClient] = None,
+    journal: Optional[CycleJournal] = None,
+    dedup: Optional[DedupIndex] = None
+) -> Iterator[BatchResult]:
+    """Run many generation cycles concurrently, yielding results as they finish.
+
+    Configs are consumed lazily and at most ``2 * max_workers`` cycles are
+    queued at once, so arbitrarily long inputs run in bounded memory. Every
+    cycle shares one LLM client, cache and connection pool.
+
+    Args:
+        configs: Cycle configurations, e.g. one per (course, article, difficulty)
+        max_workers: Cycles running at the same time
+        rate_limit: Optional cap on LLM requests per second across the batch
+        llm: Client whose transport and cache are shared; a default one otherwise
+        journal: Optional journal making the batch resumable; configs without
+            a ``cycle_id`` are keyed by input position and content, so rerun
+            the same input sequence to resume
+        dedup: Optional question bank index shared by every cycle
+
+    Yields:
+        One BatchResult per config in completion order; a failed cycle
+        carries its error instead of aborting the batch
+    """
+    shared = llm or LLMClient(LLMConfig())
+    if rate_limit:
+        shared = shared.with_config(
+            shared.config, RateLimiter(requests_per_minute=rate_limit * 60)
+        )
+
+    queue = iter(enumerate(configs))
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        pending: Dict["Future[GenerationCycle]", Tuple[int, CycleConfig]] = {}
+
+        def submit(count: int) -> None:
+            for index, config in islice(queue, count):
+                config = _with_cycle_id(index, config)
+                pending[pool.submit(_run_one, config, shared, journal, dedup)] = (index, config)
+
+        submit(2 * max_workers)
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, config = pending.pop(future)
+                yield _collect(index, config, future)
+            submit(len(done))
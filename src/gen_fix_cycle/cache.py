@@ -0,0 +1,140 @@
+"""Content-addressed cache for parsed LLM responses."""
+
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from .config import LLMConfig
+
+def cache_key(config: LLMConfig, system: str, prompt: str, prefix: str = "") -> str:
+    """Hash everything that determines a completion."""
+    payload = json.dumps({
+        "model": config.model,
+        "temperature": config.temperature,
+        "max_tokens": config.max_tokens,
+        "top_p": config.top_p,
+        "system": system,
+        "prefix": prefix,
+        "prompt": prompt
+    }, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for a ResponseCache."""
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+class ResponseCache:
+    """Two-tier response cache: an in-memory LRU in front of optional SQLite.
+
+    Args:
+        path: SQLite file for the persistent tier; memory only when None
+        max_entries: Capacity of the in-memory LRU tier
+        max_disk_entries: Capacity of the disk tier, least recently used first out
+        ttl: Seconds an entry stays valid; entries never expire when None
+
+    Hits served from memory are recorded and written to the disk tier's
+    access times with the next ``put`` (or ``flush``), so the disk cap
+    evicts the least recently used entries, not the hottest ones.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_entries: int = 1024,
+        max_disk_entries: Optional[int] = None,
+        ttl: Optional[float] = None
+    ):
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._memory: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._touched: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False) if path else None
+        if self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value TEXT, stored_at REAL, used_at REAL)"
+            )
+
+    def _expired(self, stored_at: float) -> bool:
+        return self.ttl is not None and time.time() - stored_at > self.ttl
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached response for ``key`` or None."""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry and not self._expired(entry[0]):
+                self._memory.move_to_end(key)
+                if self._db:
+                    self._touched[key] = time.time()
+                self.stats.hits += 1
+                return entry[1]
+            row = self._db.execute(
+                "SELECT value, stored_at FROM responses WHERE key = ?", (key,)
+            ).fetchone() if self._db else None
+            if row and not self._expired(row[1]):
+                self._db.execute("UPDATE responses SET used_at = ? WHERE key = ?", (time.time(), key))
+                self._db.commit()
+                self._remember(key, row[1], json.loads(row[0]))
+                self.stats.hits += 1
+                self.stats.disk_hits += 1
+                return self._memory[key][1]
+            self.stats.misses += 1
+            return None
+
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        """Store a parsed response in both tiers."""
+        now = time.time()
+        with self._lock:
+            self._remember(key, now, value)
+            if not self._db:
+                return
+            self._write_touched()
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value), now, now)
+            )
+            if self.max_disk_entries is not None:
+                evicted = self._db.execute(
+                    "DELETE FROM responses WHERE key NOT IN "
+                    "(SELECT key FROM responses ORDER BY used_at DESC LIMIT ?)",
+                    (self.max_disk_entries,)
+                ).rowcount
+                self.stats.evictions += evicted
+            self._db.commit()
+
+    def flush(self) -> None:
+        """Write access times of memory hits to the disk tier."""
+        with self._lock:
+            if self._db and self._touched:
+                self._write_touched()
+                self._db.commit()
+
+    def _write_touched(self) -> None:
+        self._db.executemany(
+            "UPDATE responses SET used_at = ? WHERE key = ?",
+            [(used_at, key) for key, used_at in self._touched.items()]
+        )
+        self._touched.clear()
+
+    def _remember(self, key: str, stored_at: float, value: Dict[str, Any]) -> None:
+        self._memory[key] = (stored_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.stats.evictions += 1
+
+    def snapshot(self) -> Dict[str, int]:
+        """Return the current counters as a plain dict."""
+        return asdict(self.stats)
@@ -0,0 +1,57 @@
+"""Helpers for running independent LLM calls concurrently."""
+
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+import threading
+from typing import Callable, Iterator, List, TypeVar
+
+T = TypeVar("T")
+
+def run_concurrently(calls: List[Callable[[], T]], max_workers: int) -> List[T]:
+    """Run zero-argument calls on a thread pool and return results in order.
+
+    Runs inline when ``max_workers`` is 1 or there is at most one call.
+    """
+    if max_workers <= 1 or len(calls) <= 1:
+        return [call() for call in calls]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(calls))) as pool:
+        return list(pool.map(lambda call: call(), calls))
+
+class AdaptiveConcurrency:
+    """AIMD limit on in-flight requests shared by many threads.
+
+    The limit grows by roughly one slot per window of successful calls and
+    halves whenever the API signals throttling.
+    """
+
+    def __init__(self, initial: int = 8, minimum: int = 1, maximum: int = 64):
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.in_flight = 0
+        self._cond = threading.Condition()
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Hold one in-flight slot for the duration of a request."""
+        with self._cond:
+            while self.in_flight >= int(self.limit):
+                self._cond.wait()
+            self.in_flight += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self.in_flight -= 1
+                self._cond.notify_all()
+
+    def on_success(self) -> None:
+        """Additively widen the limit after a successful request."""
+        with self._cond:
+            self.limit = min(self.maximum, self.limit + 1 / self.limit)
+            self._cond.notify_all()
+
+    def on_throttle(self) -> None:
+        """Multiplicatively shrink the limit after a throttled request."""
+        with self._cond:
+            self.limit = max(self.minimum, self.limit / 2)
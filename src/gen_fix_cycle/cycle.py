@@ -1,17 +1,29 @@
 """Main orchestration for the generation-fix cycle."""
 
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, field
+import hashlib
+import json
 import logging
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Set
 
+from .article import prepare_article
 from .config import LLMConfig
+from .dedup import DedupIndex
+from .journal import CycleJournal
+from .lint import QuestionLinter
 from .llm import LLMClient, parse_question_response
-from .models import Question, QCResult, GenerationCycle, Difficulty
-from .prompts.gen import get_generation_prompt
-from .prompts.qc import QualityChecker
+from .models import Question, QCResult, GenerationCycle, Difficulty, FixRound, ResponseSchemas
+from .prompts.qc import QualityChecker, touched_checks
+from .prompts.qc_policy import QCPolicy
+from .prompts.registry import PROMPTS
 from .prompts.fix import QuestionFixer
-from .prompts.criteria import get_criteria
 from .config import get_subject
+from .serialization import (
+    qc_result_from_dict,
+    qc_result_to_dict,
+    question_from_dict,
+    question_to_dict
+)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -24,69 +36,235 @@ class CycleConfig:
     ek_codes: Optional[List[str]] = None
     lo_codes: Optional[List[str]] = None
     target_difficulty: Difficulty = Difficulty.ANALYZE
-    llm_config: LLMConfig = LLMConfig()
+    llm_config: LLMConfig = field(default_factory=LLMConfig)
+    qc_concurrency: int = 4
+    lint: bool = True
+    qc_policy: Optional[QCPolicy] = None
+    qc_mode: str = 'per_check'  # per_check or combined
+    qc_early_stop: bool = False
+    dedup_examples: int = 5  # prior questions shown to the model when deduplicating
+    article_token_budget: Optional[int] = None  # QC gets a relevant excerpt of this size
+    max_fix_rounds: int = 3
+    max_fix_calls: Optional[int] = None  # LLM calls the QC/fix loop may spend
+    cycle_id: Optional[str] = None
+
+def config_key(config: CycleConfig) -> str:
+    """Stable content hash of the inputs that define a cycle."""
+    payload = json.dumps([
+        config.course,
+        config.article,
+        config.ek_codes,
+        config.lo_codes,
+        config.target_difficulty.name,
+        asdict(config.llm_config)
+    ], sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
 
 class GenerationCycleManager:
-    """Manages the complete generation-fix cycle for questions."""
+    """Manages the complete generation-fix cycle for questions.
+
+    With a ``journal``, every stage output is recorded under the cycle ID and
+    stages recorded by an earlier, interrupted run are reused, not redone.
+    With a ``dedup`` index, the prompt lists the latest prior questions on
+    the article, the first generated question that is not a near-duplicate
+    is kept and added to the index in the same step, and a revised final
+    question is indexed too once the cycle settles.
+    """
     
-    def __init__(self, config: CycleConfig):
+    def __init__(
+        self,
+        config: CycleConfig,
+        llm: Optional[LLMClient] = None,
+        journal: Optional[CycleJournal] = None,
+        dedup: Optional[DedupIndex] = None
+    ):
         self.config = config
         self.subject = get_subject(config.course)
         if not self.subject:
             raise ValueError(f"Unknown course: {config.course}")
             
-        self.llm = LLMClient(config.llm_config)
-        self.qc = QualityChecker(self.llm)
+        self.cycle_id = config.cycle_id or config_key(config)
+        self.journal = journal
+        self.dedup = dedup
+        self.article_key = hashlib.sha256(config.article.encode("utf-8")).hexdigest()[:16]
+        self.llm = llm or LLMClient(config.llm_config)
+        self.qc = QualityChecker(
+            self.llm,
+            config.qc_concurrency,
+            config.qc_policy,
+            config.qc_mode,
+            config.qc_early_stop
+        )
         self.fixer = QuestionFixer(self.llm)
+        self.linter = QuestionLinter() if config.lint else None
         
     def generate_question(self) -> Question:
         """Generate initial question and responses."""
         logger.info("Generating initial question")
         
-        prompt = get_generation_prompt(
-            'mcq',
+        prefix, prompt = PROMPTS.assemble(
+            'gen.mcq_prefix',
+            'gen.mcq',
+            self.subject,
             article=self.config.article,
             ek_codes=self.config.ek_codes,
             lo_codes=self.config.lo_codes,
-            criteria=get_criteria(self.subject, 'question'),
-            difficulty=self.config.target_difficulty.value
+            difficulty=self.config.target_difficulty.value,
+            existing=self._existing_questions()
+        )
+        
+        response = self.llm.complete(prompt, prefix=prefix, schema=ResponseSchemas.QUESTIONS)
+        questions = [
+            parse_question_response(data, self.config.target_difficulty)
+            for data in response["questions"]
+        ]
+        if self.dedup is None:
+            return questions[0]
+        for question in questions:
+            if self.dedup.add_if_unique(self.cycle_id, question, group=self.article_key):
+                return question
+        raise ValueError("Every generated question duplicates one already in the bank")
+        
+    def _existing_questions(self) -> str:
+        if self.dedup is None:
+            return ""
+        existing = self.dedup.similar(None, self.config.dedup_examples, group=self.article_key)
+        if not existing:
+            return ""
+        return "- Not repeat or closely paraphrase these existing questions:\n" + "\n".join(
+            f"      * {text}" for text in existing
+        )
+        
+    def _record(self, stage: str, payload: Any) -> None:
+        if self.journal:
+            self.journal.record(self.cycle_id, stage, payload)
+        
+    def _article_for(self, question: Question) -> str:
+        if self.config.article_token_budget is None:
+            return self.config.article
+        query = " ".join(
+            [question.text, question.ek_code or "", question.lo_code or ""]
+            + [r.text for r in question.responses]
         )
+        return prepare_article(self.config.article).excerpt(query, self.config.article_token_budget)
         
-        response = self.llm.complete(prompt)
-        return parse_question_response(response)
+    def _run_checks(
+        self,
+        question: Question,
+        names: List[str],
+        done: Dict[str, Any],
+        stage: str = ""
+    ) -> Dict[str, QCResult]:
+        results = {
+            name: qc_result_from_dict(done[f"{stage}qc:{name}"])
+            for name in names if f"{stage}qc:{name}" in done
+        }
+        missing = [name for name in names if name not in results]
+        if missing:
+            # Journal each check as it returns, so a failing one does not lose the rest
+            def record(result: QCResult) -> None:
+                self._record(f"{stage}qc:{result.check_type or ''}", qc_result_to_dict(result))
+
+            for result in self.qc.run_checks(question, self._article_for(question), missing, record):
+                results[result.check_type or ''] = result
+        return results
+        
+    def _fix(
+        self,
+        question: Question,
+        qc_results: List[QCResult],
+        done: Dict[str, Any],
+        stage: str = ""
+    ) -> Optional[Question]:
+        if f"{stage}fixed" in done:
+            return question_from_dict(done[f"{stage}fixed"]) if done[f"{stage}fixed"] else None
+        fixed = self.fixer.fix_question(question, qc_results)
+        self._record(f"{stage}fixed", question_to_dict(fixed) if fixed else None)
+        return fixed
+        
+    def _check_round(
+        self,
+        index: int,
+        question: Question,
+        results: Dict[str, QCResult],
+        touched: Set[str],
+        done: Dict[str, Any],
+        stage: str
+    ) -> FixRound:
+        lint_failures = self.linter.lint(question) if self.linter else []
+        if lint_failures:
+            logger.info("Question failed local lint; skipping LLM quality checks")
+            return FixRound(index, question, lint_failures, [])
+        checked = [name for name in self.qc.checks if name in touched or name not in results]
+        results.update(self._run_checks(question, checked, done, stage))
+        return FixRound(index, question, [results[n] for n in self.qc.checks if n in results], checked)
         
     def run_cycle(self) -> GenerationCycle:
-        """Run a complete generation-fix cycle."""
+        """Run a generation cycle, fixing and re-checking until QC passes.
+
+        Each round re-runs only the checks whose inputs the last fix changed
+        and reuses earlier results for the rest. The loop stops after
+        ``max_fix_rounds`` fixes or once ``max_fix_calls`` would be exceeded,
+        leaving the cycle ``needs_revision``. ``qc_results`` holds the last
+        round's scores; the original question's are ``history[0]``.
+        """
         logger.info("Starting generation cycle")
+        done = self.journal.stages(self.cycle_id) if self.journal else {}
         
-        question = self.generate_question()
+        if "question" in done:
+            question = question_from_dict(done["question"])
+        else:
+            question = self.generate_question()
+            self._record("question", question_to_dict(question))
         cycle = GenerationCycle(
             original_question=question,
-            qc_results=[]
+            qc_results=[],
+            cycle_id=self.cycle_id
         )
         
-        qc_results = self.qc.run_all_checks(
-            question=question,
-            article=self.config.article
-        )
-        cycle.qc_results = qc_results
-        
-        if cycle.needs_revision():
-            logger.info("Question needs revision")
-            fixed_question = self.fixer.fix_question(question, qc_results)
-            if fixed_question:
-                cycle.final_question = fixed_question
+        results: Dict[str, QCResult] = {}
+        current, touched, calls = question, set(self.qc.checks), 0
+        for index in range(self.config.max_fix_rounds + 1):
+            stage = f"round{index}:" if index else ""
+            fix_round = self._check_round(index, current, results, touched, done, stage)
+            cycle.history.append(fix_round)
+            cycle.qc_results = fix_round.qc_results
+            calls += 1 if self.qc.mode == 'combined' and fix_round.checked else len(fix_round.checked)
+            
+            failed = [r for r in fix_round.qc_results if r.score == 0]
+            if not failed:
+                logger.info("Question passed QC")
+                cycle.final_question = current
                 cycle.status = "complete"
-            else:
-                cycle.status = "failed"
-        else:
-            logger.info("Question passed QC")
-            cycle.final_question = question
-            cycle.status = "complete"
+                break
+            budget = self.config.max_fix_calls
+            if index == self.config.max_fix_rounds or (budget is not None and calls + len(failed) > budget):
+                cycle.final_question = current if current is not question else None
+                cycle.status = "needs_revision"
+                break
+                
+            logger.info(f"Question needs revision (round {index + 1})")
+            fixed = self._fix(current, fix_round.qc_results, done, stage)
+            calls += len(failed)
+            if not fixed:
+                cycle.final_question = current if current is not question else None
+                cycle.status = "needs_revision" if cycle.final_question else "failed"
+                break
+            touched = touched_checks(current, fixed)
+            current = fixed
             
+        final = cycle.final_question
+        if self.dedup is not None and final is not None and final is not question:
+            self.dedup.add(f"{self.cycle_id}:final", final, group=self.article_key)
+        self._record("status", cycle.status)
         return cycle
 
-def run_generation(config: CycleConfig) -> GenerationCycle:
+def run_generation(
+    config: CycleConfig,
+    llm: Optional[LLMClient] = None,
+    journal: Optional[CycleJournal] = None,
+    dedup: Optional[DedupIndex] = None
+) -> GenerationCycle:
     """Run a generation cycle with the given configuration."""
-    manager = GenerationCycleManager(config)
+    manager = GenerationCycleManager(config, llm, journal, dedup)
     return manager.run_cycle()
@@ -0,0 +1,178 @@
+"""Near-duplicate detection over a question bank with MinHash and LSH."""
+
+from array import array
+import hashlib
+import random
+import re
+import sqlite3
+import threading
+from typing import Dict, List, Optional, Set, Tuple
+
+from .models import Question
+
+MERSENNE = (1 << 61) - 1
+WORD_RE = re.compile(r"[a-z0-9]+")
+
+Signature = Tuple[int, ...]
+
+def question_text(question: Question) -> str:
+    """Text a question is compared on: its stem and all of its responses."""
+    return " ".join([question.text] + [r.text for r in question.responses])
+
+def shingles(text: str, size: int = 2) -> Set[int]:
+    """Hash the word n-grams of ``text`` to 64-bit integers."""
+    words = WORD_RE.findall(text.lower())
+    grams = [" ".join(words[i:i + size]) for i in range(max(1, len(words) - size + 1))]
+    return {
+        int.from_bytes(hashlib.blake2b(g.encode("utf-8"), digest_size=8).digest(), "little")
+        for g in grams
+    }
+
+def similarity(a: Signature, b: Signature) -> float:
+    """Estimated Jaccard similarity of the shingle sets behind two signatures."""
+    return sum(x == y for x, y in zip(a, b)) / len(a)
+
+class DedupIndex:
+    """MinHash/LSH index of generated questions, optionally persisted to SQLite.
+
+    Signatures are split into ``bands``; questions sharing any band are
+    candidates and are compared on their full signatures, so a lookup
+    touches only a handful of entries however large the bank grows. Use
+    one index per course.
+
+    Args:
+        path: SQLite file to load from and save to; memory only when None
+        num_perm: MinHash signature length
+        bands: LSH bands; ``num_perm`` must be a multiple of it
+        threshold: Similarity at or above which a question is a duplicate
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        num_perm: int = 64,
+        bands: int = 16,
+        threshold: float = 0.8
+    ):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        rng = random.Random(1)
+        self.params = [(rng.randrange(1, MERSENNE), rng.randrange(MERSENNE)) for _ in range(num_perm)]
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self._entries: Dict[str, Tuple[str, Optional[str], Signature]] = {}
+        self._buckets: Dict[Tuple[int, int], List[str]] = {}
+        self._groups: Dict[str, List[str]] = {}
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False) if path else None
+        if self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS questions ("
+                "key TEXT PRIMARY KEY, grp TEXT, text TEXT, signature BLOB)"
+            )
+            for key, group, text, blob in self._db.execute("SELECT * FROM questions"):
+                signature = tuple(array("Q", blob))
+                if len(signature) != num_perm:
+                    raise ValueError(f"Index at {path} was built with a different num_perm")
+                self._insert(key, text, group, signature)
+
+    def signature(self, text: str) -> Signature:
+        """MinHash signature of a text's shingles."""
+        hashes = shingles(text)
+        return tuple(min((a * h + b) % MERSENNE for h in hashes) for a, b in self.params)
+
+    def _band_keys(self, signature: Signature) -> List[Tuple[int, int]]:
+        return [
+            (i, hash(signature[i * self.rows:(i + 1) * self.rows]))
+            for i in range(len(signature) // self.rows)
+        ]
+
+    def _insert(self, key: str, text: str, group: Optional[str], signature: Signature) -> None:
+        self._entries[key] = (text, group, signature)
+        for band in self._band_keys(signature):
+            self._buckets.setdefault(band, []).append(key)
+        if group is not None:
+            self._groups.setdefault(group, []).append(key)
+
+    def _store(self, key: str, text: str, group: Optional[str], signature: Signature) -> None:
+        self._insert(key, text, group, signature)
+        if self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO questions VALUES (?, ?, ?, ?)",
+                (key, group, text, array("Q", signature).tobytes())
+            )
+            self._db.commit()
+
+    def add(self, key: str, question: Question, group: Optional[str] = None) -> None:
+        """Index a question under ``key``; ``group`` is e.g. its article."""
+        signature = self.signature(question_text(question))
+        with self._lock:
+            if key not in self._entries:
+                self._store(key, question.text, group, signature)
+
+    def add_if_unique(self, key: str, question: Question, group: Optional[str] = None) -> bool:
+        """Index a question unless it near-duplicates an indexed one.
+
+        The check and the insert happen under one lock, so concurrent cycles
+        cannot both admit the same question. Returns True when the question
+        is indexed under ``key``, including by an earlier call.
+        """
+        signature = self.signature(question_text(question))
+        with self._lock:
+            if key in self._entries:
+                return True
+            if self._near_duplicates(signature):
+                return False
+            self._store(key, question.text, group, signature)
+            return True
+
+    def _ranked(self, signature: Signature, keys: Set[str]) -> List[Tuple[str, float]]:
+        scored = [(key, similarity(signature, self._entries[key][2])) for key in keys]
+        return sorted(scored, key=lambda item: item[1], reverse=True)
+
+    def near_duplicates(self, question: Question) -> List[Tuple[str, float]]:
+        """Keys and similarities of indexed questions at or above the threshold."""
+        signature = self.signature(question_text(question))
+        with self._lock:
+            return self._near_duplicates(signature)
+
+    def _near_duplicates(self, signature: Signature) -> List[Tuple[str, float]]:
+        keys = {key for band in self._band_keys(signature) for key in self._buckets.get(band, [])}
+        return [item for item in self._ranked(signature, keys) if item[1] >= self.threshold]
+
+    def is_duplicate(self, question: Question) -> bool:
+        return bool(self.near_duplicates(question))
+
+    def similar(
+        self,
+        text: Optional[str],
+        k: int,
+        group: Optional[str] = None,
+        scan: int = 1000
+    ) -> List[str]:
+        """Texts of the ``k`` indexed questions most similar to ``text``.
+
+        Candidates are LSH matches plus the latest ``scan`` questions of
+        ``group``, ranked by similarity and then recency. Without ``text``,
+        e.g. before anything has been generated, the latest of ``group``
+        are returned.
+        """
+        signature = self.signature(text) if text else None
+        with self._lock:
+            recent = self._groups.get(group, [])[-scan:] if group is not None else []
+            order = {key: i for i, key in enumerate(recent)}
+            keys = set(recent)
+            if signature:
+                keys.update(key for band in self._band_keys(signature) for key in self._buckets.get(band, []))
+            ranked = sorted(
+                keys,
+                key=lambda key: (
+                    similarity(signature, self._entries[key][2]) if signature else 0.0,
+                    order.get(key, -1)
+                ),
+                reverse=True
+            )
+            return [self._entries[key][0] for key in ranked[:k]]
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,91 @@
+"""Append-only JSONL journal of cycle stage outputs for resumable runs."""
+
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List
+
+class CycleJournal:
+    """Records each stage's output keyed by cycle ID.
+
+    Records are buffered and written with one fsync per ``flush_every``
+    records or ``flush_interval`` seconds, whichever comes first; a
+    background timer flushes a quiet journal so no record waits longer than
+    about ``flush_interval`` for the next one to arrive. Reopening
+    the same path replays earlier records so finished stages can be skipped.
+    A partial last line left by a crash is ignored.
+    """
+
+    def __init__(self, path: str, flush_every: int = 64, flush_interval: float = 1.0):
+        self.path = path
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self._stages: Dict[str, Dict[str, Any]] = {}
+        self._buffer: List[str] = []
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            self._replay()
+        self._file = open(path, "a", encoding="utf-8")
+        self._closed = threading.Event()
+        self._timer = threading.Thread(target=self._flush_periodically, daemon=True)
+        self._timer.start()
+
+    def _flush_periodically(self) -> None:
+        while not self._closed.wait(self.flush_interval):
+            with self._lock:
+                if self._buffer:
+                    self._flush()
+
+    def _replay(self) -> None:
+        valid = 0
+        with open(self.path, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                record = json.loads(line)
+                self._stages.setdefault(record["cycle_id"], {})[record["stage"]] = record["payload"]
+                valid += len(line)
+        os.truncate(self.path, valid)
+
+    def stages(self, cycle_id: str) -> Dict[str, Any]:
+        """Return the recorded payloads of a cycle keyed by stage name."""
+        with self._lock:
+            return dict(self._stages.get(cycle_id, {}))
+
+    def record(self, cycle_id: str, stage: str, payload: Any) -> None:
+        """Append a stage output; later records for a stage replace earlier ones."""
+        line = json.dumps({"cycle_id": cycle_id, "stage": stage, "payload": payload})
+        with self._lock:
+            self._stages.setdefault(cycle_id, {})[stage] = payload
+            self._buffer.append(line + "\n")
+            due = time.monotonic() - self._last_flush >= self.flush_interval
+            if len(self._buffer) >= self.flush_every or due:
+                self._flush()
+
+    def flush(self) -> None:
+        """Write buffered records and fsync the journal."""
+        with self._lock:
+            self._flush()
+
+    def _flush(self) -> None:
+        if self._buffer:
+            self._file.write("".join(self._buffer))
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._buffer.clear()
+        self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        """Flush and close the journal file."""
+        self._closed.set()
+        self._timer.join()
+        self.flush()
+        self._file.close()
+
+    def __enter__(self) -> "CycleJournal":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
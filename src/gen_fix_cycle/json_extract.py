@@ -0,0 +1,131 @@
+"""Tolerant extraction and validation of JSON objects in LLM output."""
+
+import json
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+LITERAL_CHARS = set("truefalsn")
+NUMBER_CHARS = set("0123456789+-.eE")
+STRUCTURE_CHARS = set("{}[]:,") | set(" \t\r\n")
+
+def extract_json(text: str) -> Dict[str, Any]:
+    """Return the first balanced JSON object in ``text``.
+
+    Markdown fences, leading prose and trailing prose are ignored.
+
+    Raises:
+        ValueError: If no parseable JSON object is present
+    """
+    start = text.find("{")
+    while start != -1:
+        parser = JSONStreamParser()
+        if parser.feed(text[start:]) == "complete" and parser.result is not None:
+            return parser.result
+        start = text.find("{", start + 1)
+    raise ValueError("No JSON object found in LLM response")
+
+def validate_schema(data: Any, schema: Any, path: str = "$") -> List[str]:
+    """List the ways ``data`` departs from a ResponseSchemas shape.
+
+    Every key of a dict schema must be present; a list schema requires a
+    list, and a list holding one dict schema applies it to every item.
+    """
+    if isinstance(schema, dict):
+        if not isinstance(data, dict):
+            return [f"{path} should be an object"]
+        errors = [f"{path}.{key} is missing" for key in schema if key not in data]
+        for key, sub in schema.items():
+            if key in data:
+                errors += validate_schema(data[key], sub, f"{path}.{key}")
+        return errors
+    if isinstance(schema, list):
+        if not isinstance(data, list):
+            return [f"{path} should be a list"]
+        if schema and isinstance(schema[0], dict):
+            return [e for i, item in enumerate(data) for e in validate_schema(item, schema[0], f"{path}[{i}]")]
+    return []
+
+class JSONStreamParser:
+    """Incrementally tracks a JSON object arriving in chunks.
+
+    ``feed`` reports ``complete`` once the first object closes, so the rest
+    of the response need not be read, and ``invalid`` as soon as the text
+    cannot be JSON, e.g. bare words inside the object or a long preamble.
+    A ``{`` that fails before its first key is complete, such as a
+    ``{placeholder}`` in prose, is skipped the way ``extract_json`` skips it.
+    """
+
+    def __init__(self, max_preamble: int = 200):
+        self.max_preamble = max_preamble
+        self.text = ""
+        self.start = -1
+        self.pos = 0
+        self.depth = 0
+        self.in_string = self.escaped = self.keyed = False
+        self.result: Optional[Dict[str, Any]] = None
+
+    def feed(self, chunk: str) -> str:
+        """Consume a chunk; return ``pending``, ``complete`` or ``invalid``."""
+        self.text += chunk
+        while True:
+            if self.start == -1:
+                self.start = self.text.find("{", self.pos)
+                if self.start == -1:
+                    self.pos = len(self.text)
+                    return "invalid" if len(self.text) > self.max_preamble else "pending"
+                self.pos = self.start
+                self.depth = 0
+                self.in_string = self.escaped = self.keyed = False
+            status = self._scan()
+            if status != "invalid" or self.keyed:
+                return status
+            self.pos, self.start = self.start + 1, -1
+
+    def _scan(self) -> str:
+        for i in range(self.pos, len(self.text)):
+            ch = self.text[i]
+            if self.escaped:
+                self.escaped = False
+            elif self.in_string:
+                self.escaped = ch == "\\"
+                self.in_string = ch != '"'
+            elif ch == '"':
+                self.in_string = True
+            elif ch in "{[":
+                self.depth += 1
+            elif ch in "}]":
+                self.depth -= 1
+                if self.depth == 0:
+                    return self._finish(i + 1)
+            elif ch == ":":
+                self.keyed = True
+            elif ch not in STRUCTURE_CHARS and ch not in NUMBER_CHARS and ch not in LITERAL_CHARS:
+                return "invalid"
+        self.pos = len(self.text)
+        return "pending"
+
+    def _finish(self, end: int) -> str:
+        try:
+            self.result = json.loads(self.text[self.start:end])
+        except json.JSONDecodeError:
+            return "invalid"
+        return "complete"
+
+def read_json_stream(chunks: Iterable[str]) -> Tuple[Optional[Dict[str, Any]], str, bool]:
+    """Read chunks until a JSON object completes or the text turns invalid.
+
+    Stops consuming (and closes a generator source) as soon as the outcome
+    is known. Returns the parsed object, or None, the text read, and whether
+    reading was cut short by invalid text, in which case that text is only
+    a fragment of the response.
+    """
+    parser = JSONStreamParser()
+    iterator = iter(chunks)
+    status = "pending"
+    for chunk in iterator:
+        status = parser.feed(chunk)
+        if status != "pending":
+            break
+    close = getattr(iterator, "close", None)
+    if close:
+        close()
+    return parser.result, parser.text, status == "invalid"
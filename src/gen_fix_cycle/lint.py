@@ -0,0 +1,105 @@
+"""Deterministic pre-QC checks that need no LLM call."""
+
+import re
+from typing import Iterable, List, Pattern
+
+from .config import ABSOLUTES, BLOOM_DIFFICULT, BLOOM_EASY, BLOOM_MODERATE, PATTERN_PHRASES
+from .models import QCResult, Question
+
+def _phrase_pattern(phrases: Iterable[str], suffix: str = "") -> Pattern[str]:
+    alternatives = sorted((re.escape(p.lower()) for p in phrases), key=len, reverse=True)
+    return re.compile(rf"\b(?:{'|'.join(alternatives)}){suffix}\b", re.IGNORECASE)
+
+def _inflections(verb: str) -> List[str]:
+    """A verb with its -s, -ed and -ing forms, e.g. justify, justifies, justified."""
+    verb = verb.lower()
+    if re.search(r"[^aeiou]y$", verb):
+        stem = verb[:-1]
+        return [verb, stem + "ies", stem + "ied", verb + "ing"]
+    if verb.endswith("e"):
+        return [verb, verb + "s", verb + "d", verb[:-1] + "ing"]
+    forms = [verb, verb + ("es" if re.search(r"(?:s|sh|ch|x|z)$", verb) else "s"), verb + "ed", verb + "ing"]
+    if re.search(r"^[^aeiou]*[aeiou][^aeiouwxy]$", verb):
+        forms += [verb + verb[-1] + "ed", verb + verb[-1] + "ing"]
+    return forms
+
+ABSOLUTES_RE = _phrase_pattern(ABSOLUTES)
+PATTERN_PHRASES_RE = _phrase_pattern(PATTERN_PHRASES)
+BLOOM_VERB_RE = _phrase_pattern(
+    form for verb in BLOOM_EASY + BLOOM_MODERATE + BLOOM_DIFFICULT for form in _inflections(verb)
+)
+
+def _normalize(text: str) -> str:
+    return " ".join(text.lower().split()).rstrip(".")
+
+def _failure(check_type: str, rationale: str, feedback: str) -> QCResult:
+    return QCResult(score=0, rationale=rationale, feedback=feedback, check_type=check_type)
+
+class QuestionLinter:
+    """Rule-based checks run before the LLM quality checks.
+
+    Failures are QCResults tagged with the QC check they stand in for, so a
+    question that fails here can go straight to QuestionFixer.
+
+    Args:
+        min_options: Fewest answer options allowed
+        max_options: Most answer options allowed
+        max_length_ratio: Largest allowed ratio between the correct answer's
+            length and the mean distractor length, in either direction
+    """
+
+    def __init__(self, min_options: int = 4, max_options: int = 5, max_length_ratio: float = 1.5):
+        self.min_options = min_options
+        self.max_options = max_options
+        self.max_length_ratio = max_length_ratio
+
+    def lint(self, question: Question) -> List[QCResult]:
+        """Return every rule the question breaks; empty when it is clean."""
+        failures = []
+        texts = [r.text for r in question.responses]
+
+        if not BLOOM_VERB_RE.search(question.text):
+            failures.append(_failure(
+                'clarity',
+                "Question stem contains no Bloom's taxonomy task verb.",
+                "Rewrite the stem around a Bloom's task verb matching the target difficulty."
+            ))
+        if not self.min_options <= len(texts) <= self.max_options:
+            failures.append(_failure(
+                'format',
+                f"Question has {len(texts)} answer options.",
+                f"Provide between {self.min_options} and {self.max_options} answer options."
+            ))
+        if len({_normalize(t) for t in texts}) < len(texts):
+            failures.append(_failure(
+                'format',
+                "Two or more answer options are identical.",
+                "Make every answer option distinct."
+            ))
+
+        flagged = sorted({m.group(0).lower() for t in texts for m in ABSOLUTES_RE.finditer(t)})
+        if flagged:
+            failures.append(_failure(
+                'format',
+                f"Answer options use absolute terms: {', '.join(flagged)}.",
+                "Replace absolute terms with qualified wording."
+            ))
+        flagged = sorted({m.group(0).lower() for t in texts for m in PATTERN_PHRASES_RE.finditer(t)})
+        if flagged:
+            failures.append(_failure(
+                'format',
+                f"Answer options use overused phrases: {', '.join(flagged)}.",
+                "Reword options to avoid stock phrases that signal distractors."
+            ))
+
+        correct = [len(r.text) for r in question.responses if r.is_correct]
+        distractors = [len(r.text) for r in question.responses if not r.is_correct]
+        if correct and correct[0] and distractors and min(distractors):
+            ratio = correct[0] / (sum(distractors) / len(distractors))
+            if max(ratio, 1 / ratio) > self.max_length_ratio:
+                failures.append(_failure(
+                    'format',
+                    "Correct answer length differs markedly from the distractors.",
+                    "Make the correct answer and distractors similar in length."
+                ))
+        return failures
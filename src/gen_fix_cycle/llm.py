@@ -1,36 +1,194 @@
 """LLM interaction module using Anthropic's Claude."""
 
-import json
 import os
-from dataclasses import asdict
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, Optional, TypeVar
 
-import anthropic
+from .cache import ResponseCache, cache_key
 from .config import LLMConfig
-from .models import Question, Response, QuestionType, Difficulty, QCResult
+from .json_extract import extract_json, read_json_stream, validate_schema
+from .llm_prompts import (
+    SYSTEM_PROMPT,
+    fix_prompt,
+    generation_prefix,
+    generation_prompt,
+    quality_check_prompt,
+    repair_prompt
+)
+from .parsing import parse_qc_response, parse_question_response
+from .ratelimit import RateLimiter
+from .streaming import stream_text
+from .usage import UsageStats, estimate_tokens
+
+if TYPE_CHECKING:
+    import anthropic
+
+T = TypeVar("T")
+
+_shared_client: Optional["anthropic.Client"] = None
+
+def shared_client() -> "anthropic.Client":
+    """Return the process-wide Anthropic client so cycles reuse one pool.
+
+    The SDK is imported here rather than at module level, so importing the
+    package stays cheap for code paths that never reach the API.
+    """
+    global _shared_client
+    if _shared_client is None:
+        import anthropic
+        _shared_client = anthropic.Client(api_key=os.getenv("ANTHROPIC_API_KEY"))
+    return _shared_client
+
+def request_params(config: LLMConfig, prompt: str, prefix: Optional[str] = None) -> Dict[str, Any]:
+    """Build Messages API parameters for a prompt.
+
+    A ``prefix`` is sent as its own content block ahead of the prompt with a
+    cache-control marker, so the system prompt and prefix are cached and
+    reused by later requests that share them.
+    """
+    content: Any = prompt
+    if prefix:
+        content = [
+            {"type": "text", "text": prefix, "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": prompt}
+        ]
+    return dict(
+        model=config.model,
+        max_tokens=config.max_tokens,
+        temperature=config.temperature,
+        system=SYSTEM_PROMPT,
+        messages=[{"role": "user", "content": content}]
+    )
+
+def response_text(response: Any) -> str:
+    """Concatenate the text blocks of a Messages API response."""
+    return "".join(block.text for block in response.content if getattr(block, "text", None))
+
+def parse_json_response(response: Any) -> Dict[str, Any]:
+    """Extract the JSON payload from a Messages API response."""
+    return extract_json(response_text(response))
+
+def parse_json_text(text: str, schema: Optional[Any] = None) -> Optional[Dict[str, Any]]:
+    """Return the JSON object in ``text`` if it matches ``schema``, else None."""
+    try:
+        data = extract_json(text)
+    except ValueError:
+        return None
+    return None if schema and validate_schema(data, schema) else data
 
 class LLMClient:
-    """Client for LLM interactions using Claude."""
-    
-    def __init__(self, config: LLMConfig):
+    """Client for LLM interactions using Claude.
+
+    Instances share the process-wide Anthropic client unless ``client`` is
+    given, so the connection pool survives across cycles. With a ``cache``,
+    identical prompts under identical settings are answered locally. A
+    ``rate_limiter`` shared between instances paces, retries and bounds
+    the requests that do reach the API. Token usage, including prompt-cache
+    reads and writes, adds up in ``usage``, which derived clients share.
+    With ``stream`` set, responses are parsed as they arrive and reading
+    stops as soon as the JSON object closes or turns out malformed; a
+    malformed stream is re-requested once without streaming.
+    """
+
+    def __init__(
+        self,
+        config: LLMConfig,
+        client: Optional[Any] = None,
+        cache: Optional[ResponseCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        usage: Optional[UsageStats] = None,
+        stream: bool = False
+    ):
         self.config = config
-        self.client = anthropic.Client(api_key=os.getenv("ANTHROPIC_API_KEY"))
-        
-    def complete(self, prompt: str) -> Dict[str, Any]:
-        """Send prompt to Claude and parse JSON response."""
-        response = self.client.messages.create(
-            model=self.config.model,
-            max_tokens=self.config.max_tokens,
-            temperature=self.config.temperature,
-            system="You are an expert in AP assessment design. Always respond in valid JSON format.",
-            messages=[{"role": "user", "content": prompt}]
+        self.client = client or shared_client()
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.usage = usage or UsageStats()
+        self.stream = stream
+
+    def with_config(
+        self,
+        config: LLMConfig,
+        rate_limiter: Optional[RateLimiter] = None
+    ) -> "LLMClient":
+        """Return a client with other settings sharing this client's resources."""
+        return LLMClient(
+            config,
+            self.client,
+            self.cache,
+            rate_limiter or self.rate_limiter,
+            self.usage,
+            self.stream
         )
-        
-        # Extract and parse JSON from response
-        try:
-            return json.loads(response.content[0].text)
-        except (json.JSONDecodeError, KeyError, IndexError) as e:
-            raise ValueError(f"Failed to parse LLM response as JSON: {e}")
+
+    def complete(
+        self,
+        prompt: str,
+        prefix: Optional[str] = None,
+        schema: Optional[Any] = None
+    ) -> Dict[str, Any]:
+        """Send prompt to Claude and parse JSON response.
+
+        Stable content shared by many requests (article, criteria, examples)
+        belongs in ``prefix`` so the API can serve it from its prompt cache.
+        The first JSON object in the reply is used, fences and surrounding
+        prose ignored, and checked against ``schema`` (a ResponseSchemas
+        shape) when given. Only when that fails is a short repair prompt sent.
+        """
+        if not self.cache:
+            return self._send(prompt, prefix, schema)
+
+        key = cache_key(self.config, SYSTEM_PROMPT, prompt, prefix or "")
+        result = self.cache.get(key)
+        if result is None:
+            result = self._send(prompt, prefix, schema)
+            self.cache.put(key, result)
+        return result
+
+    def complete_stream(self, prompt: str, prefix: Optional[str] = None) -> Iterator[str]:
+        """Yield the raw response text as it arrives, bypassing the cache.
+
+        Closing the iterator cancels the request, so callers that have what
+        they need can skip the remaining output tokens.
+        """
+        params = request_params(self.config, prompt, prefix)
+        events = self._call(
+            lambda: self.client.messages.create(stream=True, **params),
+            (prefix or "") + prompt
+        )
+        return stream_text(events, self.usage)
+
+    def _send(self, prompt: str, prefix: Optional[str], schema: Optional[Any]) -> Dict[str, Any]:
+        params = request_params(self.config, prompt, prefix)
+        sent = (prefix or "") + prompt
+        text = self._call(lambda: self._request_text(params, self.stream), sent)
+        if text is None:
+            # A repair prompt needs the whole reply, not the fragment read before the abort
+            text = self._call(lambda: self._request_text(params, False), sent)
+        data = parse_json_text(text, schema)
+        if data is not None:
+            return data
+
+        repair = repair_prompt(text, schema)
+        repair_params = request_params(self.config, repair)
+        data = parse_json_text(self._call(lambda: self._request_text(repair_params, False), repair), schema)
+        if data is None:
+            raise ValueError("Failed to parse LLM response as JSON, even after a repair request")
+        return data
+
+    def _call(self, send: Callable[[], T], text: str) -> T:
+        if self.rate_limiter:
+            return self.rate_limiter.call(send, estimate_tokens(text))
+        return send()
+
+    def _request_text(self, params: Dict[str, Any], stream: bool) -> Optional[str]:
+        """The reply text, or None when a stream was aborted on malformed JSON."""
+        if stream:
+            events = self.client.messages.create(stream=True, **params)
+            _, text, aborted = read_json_stream(stream_text(events, self.usage))
+            return None if aborted else text
+        response = self.client.messages.create(**params)
+        self.usage.add(response.usage)
+        return response_text(response)
 
     def generate_question(
         self,
@@ -42,31 +200,10 @@ class LLMClient:
         existing_questions: Optional[str] = None
     ) -> Dict[str, Any]:
         """Generate a new question."""
-        prompt = f"""
-        You are a psychometrician turned high school teacher. Your task is building AP level learning assessments.
-        
-        The assessment is to test whether students read this article: {article}
-        
-        Requirements:
-        - Use task verbs from Bloom's taxonomy
-        - Connect article information to student understanding
-        - Follow these criteria: {criteria}
-        - Specify which ek_code and lo_code it addresses from: {ek_codes or 'N/A'} and {lo_codes or 'N/A'}
-        - Target difficulty level: {difficulty}
-        - Do not refer to the article in the question
-        {"- Ensure question is not similar to: " + existing_questions if existing_questions else ""}
-        
-        Output your response in this exact JSON format:
-        {{
-            "text": "question text",
-            "correct_answer": "correct answer text",
-            "distractors": ["distractor1", "distractor2", "distractor3"],
-            "explanation": "why this is correct",
-            "ek_code": "relevant code",
-            "lo_code": "relevant code"
-        }}
-        """
-        return self.complete(prompt)
+        return self.complete(
+            generation_prompt(ek_codes, lo_codes, difficulty, existing_questions),
+            prefix=generation_prefix(article, criteria)
+        )
 
     def quality_check(
         self,
@@ -76,26 +213,7 @@ class LLMClient:
         criteria: str
     ) -> Dict[str, Any]:
         """Run a quality check on a question."""
-        prompt = f"""
-        As a world-renowned expert in educational assessment with 30 years of experience designing AP exams,
-        evaluate this question's {check_type}.
-        
-        Question to evaluate: {question}
-        Responses: {responses}
-        
-        Criteria: {criteria}
-        
-        Score 1 if ALL criteria are met, 0 if ANY are not met.
-        Provide a 2-line explanation and 2 lines of actionable feedback.
-        
-        Output your response in this exact JSON format:
-        {{
-            "score": 0 or 1,
-            "rationale": "Your 2-line explanation here",
-            "feedback": "Your 2-line feedback here"
-        }}
-        """
-        return self.complete(prompt)
+        return self.complete(quality_check_prompt(question, responses, check_type, criteria))
 
     def fix_question(
         self,
@@ -105,27 +223,4 @@ class LLMClient:
         fix_type: str
     ) -> Dict[str, Any]:
         """Fix issues in a question based on QC feedback."""
-        prompt = f"""
-        As a world-renowned expert in educational assessment,
-        improve this question's {fix_type} based on QC feedback.
-        
-        Question: {question}
-        Responses: {responses}
-        Feedback: {feedback}
-        
-        Output your response in this exact JSON format:
-        {{
-            "revision_status": "revision necessary/no revision necessary",
-            "revised_question": "Your improved version of the question",
-            "revised_responses": {{
-                "correct": "revised correct answer",
-                "distractors": [
-                    "revised distractor 1",
-                    "revised distractor 2",
-                    "revised distractor 3"
-                ]
-            }},
-            "explanation": "what was changed and why"
-        }}
-        """
-        return self.complete(prompt)
+        return self.complete(fix_prompt(question, responses, feedback, fix_type))
@@ -0,0 +1,62 @@
+"""Prompt builders shared by the sync and async LLM clients."""
+
+import json
+from typing import Any, Optional
+
+from .prompts.registry import PROMPTS
+
+SYSTEM_PROMPT = "You are an expert in AP assessment design. Always respond in valid JSON format."
+
+def generation_prefix(article: str, criteria: str) -> str:
+    """Build the cacheable part of the generation prompt shared per article."""
+    return PROMPTS.render('client.generation_prefix', article=article, criteria=criteria)
+
+def generation_prompt(
+    ek_codes: Optional[str],
+    lo_codes: Optional[str],
+    difficulty: str,
+    existing_questions: Optional[str] = None
+) -> str:
+    """Build the per-question part of the generation prompt."""
+    return PROMPTS.render(
+        'client.generation',
+        ek_codes=ek_codes or 'N/A',
+        lo_codes=lo_codes or 'N/A',
+        difficulty=difficulty,
+        existing="- Ensure question is not similar to: " + existing_questions if existing_questions else ""
+    )
+
+def quality_check_prompt(
+    question: str,
+    responses: str,
+    check_type: str,
+    criteria: str
+) -> str:
+    """Build a generic quality check prompt."""
+    return PROMPTS.render(
+        'client.quality_check',
+        question=question,
+        responses=responses,
+        check_type=check_type,
+        criteria=criteria
+    )
+
+def fix_prompt(
+    question: str,
+    responses: str,
+    feedback: str,
+    fix_type: str
+) -> str:
+    """Build a generic fix prompt from QC feedback."""
+    return PROMPTS.render(
+        'client.fix',
+        question=question,
+        responses=responses,
+        feedback=feedback,
+        fix_type=fix_type
+    )
+
+def repair_prompt(text: str, schema: Optional[Any]) -> str:
+    """Build a short prompt asking for malformed output to be fixed as JSON."""
+    shape = f"matching this shape: {json.dumps(schema)}" if schema else ""
+    return PROMPTS.render('client.repair', text=text, shape=shape)
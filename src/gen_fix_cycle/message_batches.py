@@ -0,0 +1,152 @@
+"""Message Batches backend for cheap, high-latency bulk generation.
+
+``MessageBatchTransport`` stands in for the Anthropic client given to
+LLMClient. Each ``messages.create`` call is queued, submitted with others as
+one message batch, and returns once that batch has ended. Every cycle waits
+at its current step on its own worker thread and carries on when its result
+arrives, so a run looks like:
+
+    transport = MessageBatchTransport()
+    llm = LLMClient(LLMConfig(), client=transport)
+    for result in run_generation_batch(configs, max_workers=500, llm=llm):
+        ...
+
+Pair it with a CycleJournal so a restarted job does not resubmit finished
+stages. Message batches cannot stream, so the LLMClient must not be set to
+stream and QC early stopping must stay off; ``stream=True`` requests are
+rejected.
+"""
+
+from concurrent.futures import Future
+from dataclasses import dataclass
+import itertools
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from .llm import shared_client
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class BatchStats:
+    """Counters for a MessageBatchTransport."""
+    batches_submitted: int = 0
+    requests_submitted: int = 0
+    requests_failed: int = 0
+
+class MessageBatchTransport:
+    """Collects Messages API calls into message batches and polls for results.
+
+    Args:
+        client: Anthropic client exposing ``messages.batches``; a fake batch
+            service with the same surface works for tests
+        max_batch_size: Submit as soon as this many requests are queued
+        max_wait: Seconds a queued request waits for others before submission
+        poll_interval: Seconds between status checks of submitted batches
+    """
+
+    def __init__(
+        self,
+        client: Optional[Any] = None,
+        max_batch_size: int = 10000,
+        max_wait: float = 10.0,
+        poll_interval: float = 30.0
+    ):
+        self.client = client or shared_client()
+        self.messages = self
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.poll_interval = poll_interval
+        self.stats = BatchStats()
+        self._pending: List[Tuple[str, Dict[str, Any], "Future[Any]"]] = []
+        self._oldest = 0.0
+        self._in_flight: Dict[str, Dict[str, "Future[Any]"]] = {}
+        self._ids = itertools.count()
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def create(self, **params: Any) -> Any:
+        """Queue one Messages API request and block until its batch result.
+
+        Raises:
+            ValueError: If ``stream`` is requested, which batches do not support
+        """
+        if params.pop("stream", False):
+            raise ValueError("Message batches do not support streaming requests")
+        future: "Future[Any]" = Future()
+        with self._cond:
+            if not self._pending:
+                self._oldest = time.monotonic()
+            self._pending.append((f"req-{next(self._ids)}", params, future))
+            self._cond.notify()
+        return future.result()
+
+    def _take_due(self) -> List[Tuple[str, Dict[str, Any], "Future[Any]"]]:
+        with self._cond:
+            wait = self.poll_interval if self._in_flight else None
+            if self._pending:
+                wait = max(0.0, self._oldest + self.max_wait - time.monotonic())
+            if len(self._pending) < self.max_batch_size:
+                self._cond.wait(wait)
+            full = len(self._pending) >= self.max_batch_size
+            if self._pending and (full or time.monotonic() - self._oldest >= self.max_wait):
+                batch = self._pending[:self.max_batch_size]
+                self._pending = self._pending[self.max_batch_size:]
+                self._oldest = time.monotonic()
+                return batch
+            return []
+
+    def _run(self) -> None:
+        next_poll = time.monotonic()
+        while True:
+            try:
+                batch = self._take_due()
+                if batch:
+                    self._submit(batch)
+                if self._in_flight and time.monotonic() >= next_poll:
+                    self._poll()
+                    next_poll = time.monotonic() + self.poll_interval
+            except Exception:
+                logger.exception("Message batch backend error; retrying")
+                time.sleep(self.poll_interval)
+
+    def _submit(self, batch: List[Tuple[str, Dict[str, Any], "Future[Any]"]]) -> None:
+        requests = [{"custom_id": cid, "params": params} for cid, params, _ in batch]
+        try:
+            created = self.client.messages.batches.create(requests=requests)
+        except Exception as e:
+            for _, _, future in batch:
+                future.set_exception(e)
+            self.stats.requests_failed += len(batch)
+            return
+        self._in_flight[created.id] = {cid: future for cid, _, future in batch}
+        self.stats.batches_submitted += 1
+        self.stats.requests_submitted += len(batch)
+        logger.info(f"Submitted message batch {created.id} with {len(batch)} requests")
+
+    def _poll(self) -> None:
+        for batch_id in list(self._in_flight):
+            if self.client.messages.batches.retrieve(batch_id).processing_status != "ended":
+                continue
+            futures = self._in_flight[batch_id]
+            try:
+                for entry in self.client.messages.batches.results(batch_id):
+                    future = futures.pop(entry.custom_id, None)
+                    if future is None:
+                        logger.warning(f"Ignoring unknown result {entry.custom_id} in batch {batch_id}")
+                    elif entry.result.type == "succeeded":
+                        future.set_result(entry.result.message)
+                    else:
+                        self.stats.requests_failed += 1
+                        future.set_exception(RuntimeError(
+                            f"Batch request {entry.custom_id} {entry.result.type}"
+                        ))
+            finally:
+                # Whatever went wrong reading results, no caller is left waiting
+                del self._in_flight[batch_id]
+                for custom_id, future in futures.items():
+                    self.stats.requests_failed += 1
+                    future.set_exception(RuntimeError(f"Batch request {custom_id} has no result"))
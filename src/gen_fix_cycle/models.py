@@ -1,6 +1,6 @@
 """Data models for the gen-fix cycle system."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import Dict, List, Optional, Union
 
@@ -41,14 +41,25 @@ class QCResult:
     rationale: str
     feedback: str
     revised_content: Optional[str] = None
+    check_type: Optional[str] = None  # clarity, format, content, difficulty
+
+@dataclass
+class FixRound:
+    """QC outcome for one version of a question in the fix loop."""
+    round: int
+    question: Question
+    qc_results: List[QCResult]
+    checked: List[str]  # checks run this round; the rest were reused
 
 @dataclass
 class GenerationCycle:
     """Represents a complete generation cycle for a question."""
     original_question: Question
-    qc_results: List[QCResult]
+    qc_results: List[QCResult]  # latest round; history[0] has the original's
     final_question: Optional[Question] = None
-    status: str = "pending"  # pending, needs_revision, complete
+    status: str = "pending"  # pending, needs_revision, complete, failed
+    cycle_id: Optional[str] = None
+    history: List[FixRound] = field(default_factory=list)
 
     def needs_revision(self) -> bool:
         """Check if any QC checks failed."""
@@ -91,6 +102,10 @@ class ResponseSchemas:
         "ek_code": "relevant code",
         "lo_code": "relevant code"
     }
+    
+    QUESTIONS = {
+        "questions": [GENERATION]
+    }
 
 # Course to Subject Mapping
 COURSE_MAPPING: Dict[str, List[str]] = {
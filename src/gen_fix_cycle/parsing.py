@@ -0,0 +1,46 @@
+"""Conversion of parsed LLM JSON responses into data models."""
+
+from typing import Any, Dict, Optional
+
+from .models import Difficulty, QCResult, Question, QuestionType, Response
+
+def parse_question_response(
+    response: Dict[str, Any],
+    difficulty: Difficulty = Difficulty.ANALYZE
+) -> Question:
+    """Build a Question from a generation response.
+
+    Accepts either a single question object or the ``{"questions": [...]}``
+    shape produced by the MCQ template, in which case the first is used.
+    """
+    data = response["questions"][0] if "questions" in response else response
+    responses = [
+        Response(
+            text=data["correct_answer"],
+            is_correct=True,
+            explanation=data.get("explanation")
+        )
+    ] + [
+        Response(text=d, is_correct=False)
+        for d in data["distractors"]
+    ]
+    return Question(
+        text=data["text"],
+        responses=responses,
+        question_type=QuestionType.MCQ,
+        difficulty=difficulty,
+        ek_code=data.get("ek_code"),
+        lo_code=data.get("lo_code")
+    )
+
+def parse_qc_response(
+    response: Dict[str, Any],
+    check_type: Optional[str] = None
+) -> QCResult:
+    """Build a QCResult from a quality check response."""
+    return QCResult(
+        score=int(response["score"]),
+        rationale=response["rationale"],
+        feedback=response["feedback"],
+        check_type=check_type
+    )
@@ -0,0 +1,86 @@
+"""Prompt templates behind the generic LLM client helpers."""
+
+from string import Template
+
+class ClientPrompts:
+    """Templates for the prompts built in ``llm_prompts``."""
+
+    GENERATION_PREFIX = Template("""
+    You are a psychometrician turned high school teacher. Your task is building AP level learning assessments.
+
+    The assessment is to test whether students read this article: ${article}
+
+    Every question must follow these criteria: ${criteria}
+    """)
+
+    GENERATION = Template("""
+    Requirements:
+    - Use task verbs from Bloom's taxonomy
+    - Connect article information to student understanding
+    - Follow the criteria above
+    - Specify which ek_code and lo_code it addresses from: ${ek_codes} and ${lo_codes}
+    - Target difficulty level: ${difficulty}
+    - Do not refer to the article in the question
+    ${existing}
+
+    Output your response in this exact JSON format:
+    {
+        "text": "question text",
+        "correct_answer": "correct answer text",
+        "distractors": ["distractor1", "distractor2", "distractor3"],
+        "explanation": "why this is correct",
+        "ek_code": "relevant code",
+        "lo_code": "relevant code"
+    }
+    """)
+
+    QUALITY_CHECK = Template("""
+    As a world-renowned expert in educational assessment with 30 years of experience designing AP exams,
+    evaluate this question's ${check_type}.
+
+    Question to evaluate: ${question}
+    Responses: ${responses}
+
+    Criteria: ${criteria}
+
+    Score 1 if ALL criteria are met, 0 if ANY are not met.
+    Provide a 2-line explanation and 2 lines of actionable feedback.
+
+    Output your response in this exact JSON format:
+    {
+        "score": 0 or 1,
+        "rationale": "Your 2-line explanation here",
+        "feedback": "Your 2-line feedback here"
+    }
+    """)
+
+    FIX = Template("""
+    As a world-renowned expert in educational assessment,
+    improve this question's ${fix_type} based on QC feedback.
+
+    Question: ${question}
+    Responses: ${responses}
+    Feedback: ${feedback}
+
+    Output your response in this exact JSON format:
+    {
+        "revision_status": "revision necessary/no revision necessary",
+        "revised_question": "Your improved version of the question",
+        "revised_responses": {
+            "correct": "revised correct answer",
+            "distractors": [
+                "revised distractor 1",
+                "revised distractor 2",
+                "revised distractor 3"
+            ]
+        },
+        "explanation": "what was changed and why"
+    }
+    """)
+
+    REPAIR = Template("""
+    The text below was meant to be a single JSON object ${shape}.
+    Return only the corrected JSON object, with no other text.
+
+    ${text}
+    """)
@@ -1,5 +1,6 @@
 """Subject-specific criteria for question generation and evaluation."""
 
+from functools import lru_cache
 from typing import Dict, Optional
 
 class SubjectCriteria:
@@ -63,6 +64,7 @@ class SubjectCriteria:
         # Add other subjects as needed
     }
 
+@lru_cache(maxsize=None)
 def get_criteria(subject: str, criteria_type: str) -> str:
     """Get subject-specific criteria.
     
@@ -1,5 +1,8 @@
 """Example questions for each subject area."""
 
+from functools import lru_cache
+from typing import Any, Dict, Tuple
+
 SOCIAL_SCIENCE_GOOD = [
     {
         "question": "Which of the following characteristics is currently shared by Switzerland, Canada, and New Zealand?",
@@ -85,7 +88,8 @@ EXAMPLES = {
     }
 }
 
-def get_examples(subject: str, example_type: str) -> list:
+@lru_cache(maxsize=None)
+def get_examples(subject: str, example_type: str) -> Tuple[Dict[str, Any], ...]:
     """Get subject-specific examples.
     
     Args:
@@ -93,7 +97,8 @@ def get_examples(subject: str, example_type: str) -> list:
         example_type: Type of examples ('good', 'bad')
     
     Returns:
-        List of example questions for the given subject and type
+        Example questions for the given subject and type, as a tuple so
+        the cached value cannot be mutated by callers
     """
     subject_examples = EXAMPLES.get(subject, {})
-    return subject_examples.get(example_type, [])
+    return tuple(subject_examples.get(example_type, []))
@@ -1,20 +1,41 @@
 """Question fixing implementation."""
 
-from dataclasses import asdict
-from typing import Dict, List, Optional
+from dataclasses import asdict, replace
+import re
+from typing import Callable, Dict, List, Optional
 
+from ..concurrency import run_concurrently
 from ..llm import LLMClient
 from ..models import Question, QCResult, Response
-from .fix_prompts import FixPrompts
 from .qc import format_responses
+from .registry import PROMPTS
+
+WORD_RE = re.compile(r"[a-z0-9']+")
+
+def stem_overlap(before: str, after: str) -> float:
+    """Share of words two versions of a question stem have in common."""
+    a, b = set(WORD_RE.findall(before.lower())), set(WORD_RE.findall(after.lower()))
+    return len(a & b) / len(a | b) if a | b else 1.0
 
 class QuestionFixer:
-    """Manages the question fixing process."""
+    """Manages the question fixing process.
+
+    Stem and response fixes touch different fields, so they run
+    concurrently on the same question and are merged. When the rewritten
+    stem shares less than ``min_stem_overlap`` of its words with the old
+    one, the response fix is redone against the new stem instead.
+    """
     
-    def __init__(self, llm: LLMClient):
+    def __init__(
+        self,
+        llm: LLMClient,
+        max_concurrency: int = 2,
+        min_stem_overlap: float = 0.5
+    ):
         self.llm = llm
-        self.prompts = FixPrompts()
-        self.fix_types = ['clarity', 'responses', 'difficulty']
+        self.max_concurrency = max_concurrency
+        self.min_stem_overlap = min_stem_overlap
+        self.fix_types = ['clarity', 'format']
     
     def fix_clarity(
         self,
@@ -22,7 +43,8 @@ class QuestionFixer:
         feedback: str
     ) -> Optional[Question]:
         """Fix clarity issues."""
-        prompt = self.prompts.CLARITY.substitute(
+        prompt = PROMPTS.render(
+            'fix.clarity',
             question=question.text,
             feedback=feedback
         )
@@ -48,7 +70,8 @@ class QuestionFixer:
         feedback: str
     ) -> Optional[Question]:
         """Fix response issues."""
-        prompt = self.prompts.RESPONSES.substitute(
+        prompt = PROMPTS.render(
+            'fix.responses',
             question=question.text,
             responses=format_responses(question),
             feedback=feedback
@@ -82,18 +105,28 @@ class QuestionFixer:
         question: Question,
         qc_results: List[QCResult]
     ) -> Optional[Question]:
-        """Apply all needed fixes to a question."""
-        current = question
-        
+        """Apply all needed fixes to a question, dispatching on check type."""
+        feedback: Dict[str, List[str]] = {}
         for result in qc_results:
-            if result.score == 0:
-                if result.rationale == 'clarity':
-                    fixed = self.fix_clarity(current, result.feedback)
-                    if fixed:
-                        current = fixed
-                elif result.rationale in ['format', 'responses']:
-                    fixed = self.fix_responses(current, result.feedback)
-                    if fixed:
-                        current = fixed
-                        
-        return current if current != question else None
+            if result.score == 0 and result.check_type in self.fix_types:
+                feedback.setdefault(result.check_type, []).append(result.feedback)
+        clarity = "\n".join(feedback.get('clarity', []))
+        responses = "\n".join(feedback.get('format', []))
+        
+        fixers: Dict[str, Callable[[], Optional[Question]]] = {
+            'clarity': lambda: self.fix_clarity(question, clarity),
+            'format': lambda: self.fix_responses(question, responses)
+        }
+        kinds = [kind for kind in self.fix_types if kind in feedback]
+        fixes = dict(zip(kinds, run_concurrently([fixers[k] for k in kinds], self.max_concurrency)))
+        
+        stem, options = fixes.get('clarity'), fixes.get('format')
+        if stem and options and stem_overlap(question.text, stem.text) < self.min_stem_overlap:
+            options = self.fix_responses(stem, responses)
+        
+        fixed = replace(
+            question,
+            text=(stem or question).text,
+            responses=(options or question).responses
+        )
+        return fixed if fixed != question else None
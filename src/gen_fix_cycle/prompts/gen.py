@@ -4,14 +4,13 @@ from typing import List, Optional
 
 from ..llm import LLMClient
 from ..models import Question, Response, QuestionType, Difficulty
-from .gen_prompts import GenerationPrompts
+from .registry import PROMPTS
 
 class QuestionGenerator:
     """Manages the question generation process."""
     
     def __init__(self, llm: LLMClient):
         self.llm = llm
-        self.prompts = GenerationPrompts()
     
     def generate_mcq(
         self,
@@ -22,15 +21,18 @@ class QuestionGenerator:
         difficulty: Difficulty
     ) -> List[Question]:
         """Generate multiple choice questions."""
-        prompt = self.prompts.MCQ.substitute(
+        prefix, prompt = PROMPTS.assemble(
+            'gen.mcq_prefix',
+            'gen.mcq',
             article=article,
+            criteria=criteria,
             ek_codes=", ".join(ek_codes) if ek_codes else "N/A",
             lo_codes=", ".join(lo_codes) if lo_codes else "N/A",
-            criteria=criteria,
-            difficulty=difficulty.value
+            difficulty=difficulty.value,
+            existing=""
         )
         
-        response = self.llm.complete(prompt)
+        response = self.llm.complete(prompt, prefix=prefix)
         questions = []
         
         for q in response.get("questions", []):
@@ -63,7 +65,8 @@ class QuestionGenerator:
         criteria: str
     ) -> Optional[Response]:
         """Generate a correct answer for a question."""
-        prompt = self.prompts.CORRECT_ANSWER.substitute(
+        prompt = PROMPTS.render(
+            'gen.correct_answer',
             question=question,
             article=article,
             criteria=criteria
@@ -87,7 +90,8 @@ class QuestionGenerator:
         criteria: str
     ) -> List[Response]:
         """Generate distractor options."""
-        prompt = self.prompts.DISTRACTORS.substitute(
+        prompt = PROMPTS.render(
+            'gen.distractors',
             question=question,
             correct_answer=correct_answer,
             num_distractors=num_distractors,
@@ -106,17 +110,23 @@ class QuestionGenerator:
 
 def get_generation_prompt(
     prompt_type: str,
+    subject: Optional[str] = None,
     **kwargs
 ) -> str:
-    """Get a formatted generation prompt."""
-    templates = {
-        'mcq': GenerationPrompts.MCQ,
-        'correct': GenerationPrompts.CORRECT_ANSWER,
-        'distractors': GenerationPrompts.DISTRACTORS
+    """Get a formatted generation prompt.
+
+    With ``subject``, the subject's criteria are filled in from the
+    pre-rendered templates and need not be passed.
+    """
+    names = {
+        'mcq_prefix': 'gen.mcq_prefix',
+        'mcq': 'gen.mcq',
+        'correct': 'gen.correct_answer',
+        'distractors': 'gen.distractors'
     }
     
-    template = templates.get(prompt_type)
-    if not template:
+    name = names.get(prompt_type)
+    if not name:
         raise ValueError(f"Unknown prompt type: {prompt_type}")
         
-    return template.substitute(**kwargs)
+    return PROMPTS.render(name, subject, **kwargs)
@@ -3,12 +3,21 @@
 from string import Template
 
 class GenerationPrompts:
-    """Templates for question generation prompts."""
+    """Templates for question generation prompts.
+
+    ``MCQ_PREFIX`` holds the parts shared by every question on an article so
+    it can be sent as a cached prompt prefix ahead of ``MCQ``.
+    """
     
-    MCQ = Template("""
+    MCQ_PREFIX = Template("""
     You are a psychometrician turned high school teacher creating AP-level multiple choice questions.
     
     Article: ${article}
+    
+    Every question you write must follow these criteria: ${criteria}
+    """)
+    
+    MCQ = Template("""
     Essential Knowledge Codes: ${ek_codes}
     Learning Objectives: ${lo_codes}
     
@@ -16,13 +25,14 @@ class GenerationPrompts:
     - Test understanding and application of the article content
     - Use appropriate Bloom's taxonomy task verbs
     - Connect to the provided learning objectives
-    - Follow these criteria: ${criteria}
+    - Follow the criteria above
     
     Each question must:
     - Have exactly one correct answer
     - Have 3-4 plausible but incorrect distractors
     - Be answerable in one sentence
     - Not exceed difficulty level ${difficulty}
+    ${existing}
     
     Format your response as JSON with this structure:
     {
@@ -1,11 +1,52 @@
 """Quality check implementation."""
 
 from dataclasses import asdict
-from typing import Dict, List
+from typing import Callable, Dict, List, Optional, Set
 
+from ..concurrency import run_concurrently
 from ..llm import LLMClient, parse_qc_response
-from ..models import Question, QCResult
+from ..models import Question, QCResult, ResponseSchemas
+from .qc_policy import QCPolicy
 from .qc_prompts import QualityCheckPrompts
+from .qc_stream import StreamStats, stream_check
+from .registry import PROMPTS
+
+# Question field filling each QC template placeholder
+PLACEHOLDER_FIELDS = {
+    'question': 'text',
+    'responses': 'responses',
+    'ek_code': 'ek_code',
+    'lo_code': 'lo_code'
+}
+
+# Question fields each check judges, read off its template; a fix re-runs
+# only checks whose fields changed
+CHECK_INPUTS = {
+    name: {
+        PLACEHOLDER_FIELDS[placeholder]
+        for placeholder in PROMPTS.get(f'qc.{name}').placeholders
+        if placeholder in PLACEHOLDER_FIELDS
+    }
+    for name in ('clarity', 'format', 'content', 'difficulty')
+}
+
+def touched_checks(before: Question, after: Question) -> Set[str]:
+    """Names of the checks whose inputs differ between two versions."""
+    changed = {
+        name for name in PLACEHOLDER_FIELDS.values()
+        if getattr(before, name) != getattr(after, name)
+    }
+    return {check for check, inputs in CHECK_INPUTS.items() if inputs & changed}
+
+def _reporting(
+    call: Callable[[], QCResult],
+    on_result: Callable[[QCResult], None]
+) -> Callable[[], QCResult]:
+    def run() -> QCResult:
+        result = call()
+        on_result(result)
+        return result
+    return run
 
 def format_responses(question: Question) -> str:
     """Format responses for prompts."""
@@ -15,30 +56,58 @@ def format_responses(question: Question) -> str:
     )
 
 class QualityChecker:
-    """Manages the quality check process for questions."""
+    """Manages the quality check process for questions.
+
+    ``max_concurrency`` caps how many checks are in flight at once; the
+    default of 1 runs them back-to-back. A ``policy`` reorders checks and
+    may skip some, in which case fewer results than checks are returned.
+    In ``combined`` mode all requested checks are scored by one LLM call
+    and the policy does not apply. With ``early_stop``, per-check responses
+    are streamed and cut off once they score a pass, leaving that result's
+    rationale and feedback empty; latencies are kept in ``stream_stats``.
+    """
     
-    def __init__(self, llm: LLMClient):
+    def __init__(
+        self,
+        llm: LLMClient,
+        max_concurrency: int = 1,
+        policy: Optional[QCPolicy] = None,
+        mode: str = 'per_check',
+        early_stop: bool = False
+    ):
+        if mode not in ('per_check', 'combined'):
+            raise ValueError(f"Unknown QC mode: {mode}")
         self.llm = llm
-        self.prompts = QualityCheckPrompts()
         self.checks = ['clarity', 'format', 'content', 'difficulty']
+        self.max_concurrency = max_concurrency
+        self.policy = policy
+        self.mode = mode
+        self.early_stop = early_stop
+        self.stream_stats = StreamStats()
+    
+    def _check(self, prompt: str, check_type: str, prefix: Optional[str] = None) -> QCResult:
+        if self.early_stop:
+            return stream_check(self.llm, prompt, prefix, check_type, self.stream_stats)
+        response = self.llm.complete(prompt, prefix=prefix, schema=ResponseSchemas.BASIC)
+        return parse_qc_response(response, check_type)
     
     def check_clarity(self, question: Question) -> QCResult:
         """Run clarity check."""
-        prompt = self.prompts.CLARITY.substitute(
+        prompt = PROMPTS.render(
+            'qc.clarity',
             question=question.text,
             responses=format_responses(question)
         )
-        response = self.llm.complete(prompt)
-        return parse_qc_response(response)
+        return self._check(prompt, 'clarity')
     
     def check_format(self, question: Question) -> QCResult:
         """Run format check."""
-        prompt = self.prompts.FORMAT.substitute(
+        prompt = PROMPTS.render(
+            'qc.format',
             question=question.text,
             responses=format_responses(question)
         )
-        response = self.llm.complete(prompt)
-        return parse_qc_response(response)
+        return self._check(prompt, 'format')
     
     def check_content(
         self,
@@ -46,24 +115,59 @@ class QualityChecker:
         article: str
     ) -> QCResult:
         """Run content check."""
-        prompt = self.prompts.CONTENT.substitute(
+        prefix, prompt = PROMPTS.assemble(
+            'qc.article_prefix',
+            'qc.content',
+            article=article,
             question=question.text,
             responses=format_responses(question),
-            article=article,
             ek_code=question.ek_code or "N/A",
             lo_code=question.lo_code or "N/A"
         )
-        response = self.llm.complete(prompt)
-        return parse_qc_response(response)
+        return self._check(prompt, 'content', prefix)
     
     def check_difficulty(self, question: Question) -> QCResult:
         """Run difficulty check."""
-        prompt = self.prompts.DIFFICULTY.substitute(
+        prompt = PROMPTS.render(
+            'qc.difficulty',
             question=question.text,
             responses=format_responses(question)
         )
-        response = self.llm.complete(prompt)
-        return parse_qc_response(response)
+        return self._check(prompt, 'difficulty')
+    
+    def check_combined(
+        self,
+        question: Question,
+        article: str,
+        names: List[str]
+    ) -> List[QCResult]:
+        """Score the named checks with a single LLM call."""
+        prompt = PROMPTS.render(
+            'qc.combined',
+            question=question.text,
+            responses=format_responses(question),
+            ek_code=question.ek_code or "N/A",
+            lo_code=question.lo_code or "N/A",
+            criteria="\n\n    ".join(QualityCheckPrompts.COMBINED_CRITERIA[name] for name in names),
+            names=", ".join(names)
+        )
+        prefix = PROMPTS.render('qc.article_prefix', article=article) if 'content' in names else None
+        schema = {name: ResponseSchemas.BASIC for name in names}
+        response = self.llm.complete(prompt, prefix=prefix, schema=schema)
+        return [parse_qc_response(response[name], name) for name in names]
+    
+    def check_calls(
+        self,
+        question: Question,
+        article: str
+    ) -> Dict[str, Callable[[], QCResult]]:
+        """Map each check name to a zero-argument call that runs it."""
+        return {
+            'clarity': lambda: self.check_clarity(question),
+            'format': lambda: self.check_format(question),
+            'content': lambda: self.check_content(question, article),
+            'difficulty': lambda: self.check_difficulty(question)
+        }
     
     def run_all_checks(
         self,
@@ -71,9 +175,33 @@ class QualityChecker:
         article: str
     ) -> List[QCResult]:
         """Run all quality checks on a question."""
-        return [
-            self.check_clarity(question),
-            self.check_format(question),
-            self.check_content(question, article),
-            self.check_difficulty(question)
-        ]
+        return self.run_checks(question, article, self.checks)
+    
+    def run_checks(
+        self,
+        question: Question,
+        article: str,
+        names: List[str],
+        on_result: Optional[Callable[[QCResult], None]] = None
+    ) -> List[QCResult]:
+        """Run the named quality checks on a question.
+
+        Checks are independent, so with ``max_concurrency`` above 1 they are
+        sent together on a thread pool. Results keep the order of ``names``.
+        ``on_result`` is called with each result as soon as its check
+        returns, before slower checks finish or fail.
+        """
+        if self.mode == 'combined':
+            results = self.check_combined(question, article, names) if names else []
+            for result in results if on_result else []:
+                on_result(result)
+            return results
+        
+        calls = self.check_calls(question, article)
+        if on_result:
+            calls = {name: _reporting(call, on_result) for name, call in calls.items()}
+        if not self.policy:
+            return run_concurrently([calls[name] for name in names], self.max_concurrency)
+        
+        results = self.policy.execute(names, calls, self.max_concurrency)
+        return sorted(results, key=lambda r: names.index(r.check_type or ''))
@@ -0,0 +1,100 @@
+"""Ordering and early-exit policy for quality checks."""
+
+from dataclasses import dataclass, field
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ..concurrency import run_concurrently
+from ..models import QCResult
+
+@dataclass
+class CheckStats:
+    """Observed outcomes of one quality check."""
+    runs: int = 0
+    failures: int = 0
+    total_seconds: float = 0.0
+
+    @property
+    def fail_rate(self) -> float:
+        """Failure rate with add-one smoothing so unseen checks rank fairly."""
+        return (self.failures + 1) / (self.runs + 2)
+
+    @property
+    def mean_seconds(self) -> float:
+        """Mean latency; 1 second until the check has run."""
+        return self.total_seconds / self.runs if self.runs else 1.0
+
+@dataclass
+class QCPolicy:
+    """Decides which checks QualityChecker runs, in what order, and when to stop.
+
+    Args:
+        order: Fixed check order; the checker's order when None
+        adaptive: Rank checks by observed failures per second of latency, so
+            cheap, frequently failing checks run first
+        max_failures: Stop once this many checks have failed
+        gated: Expensive checks run only after every other check passed
+    """
+    order: Optional[List[str]] = None
+    adaptive: bool = False
+    max_failures: Optional[int] = None
+    gated: List[str] = field(default_factory=lambda: ['content'])
+    stats: Dict[str, CheckStats] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def plan(self, names: List[str]) -> Tuple[List[str], List[str]]:
+        """Split checks into an ordered first pass and the gated checks."""
+        ordered = [n for n in self.order if n in names] if self.order else list(names)
+        if self.adaptive:
+            with self._lock:
+                stats = {n: self.stats.get(n, CheckStats()) for n in ordered}
+            ordered.sort(key=lambda n: stats[n].fail_rate / stats[n].mean_seconds, reverse=True)
+        return [n for n in ordered if n not in self.gated], [n for n in ordered if n in self.gated]
+
+    def record(self, name: str, result: QCResult, seconds: float) -> None:
+        """Add one check outcome to the running statistics."""
+        with self._lock:
+            stats = self.stats.setdefault(name, CheckStats())
+            stats.runs += 1
+            stats.failures += result.score == 0
+            stats.total_seconds += seconds
+
+    def _timed(self, name: str, call: Callable[[], QCResult]) -> Callable[[], QCResult]:
+        def run() -> QCResult:
+            start = time.perf_counter()
+            result = call()
+            self.record(name, result, time.perf_counter() - start)
+            return result
+        return run
+
+    def _run_pass(
+        self,
+        names: List[str],
+        calls: Dict[str, Callable[[], QCResult]],
+        max_concurrency: int,
+        results: List[QCResult]
+    ) -> None:
+        remaining = list(names)
+        while remaining:
+            failures = sum(r.score == 0 for r in results)
+            if self.max_failures is not None and failures >= self.max_failures:
+                return
+            allowance = self.max_failures - failures if self.max_failures else len(remaining)
+            size = max(1, min(max_concurrency, allowance))
+            wave, remaining = remaining[:size], remaining[size:]
+            results += run_concurrently([self._timed(n, calls[n]) for n in wave], max_concurrency)
+
+    def execute(
+        self,
+        names: List[str],
+        calls: Dict[str, Callable[[], QCResult]],
+        max_concurrency: int
+    ) -> List[QCResult]:
+        """Run checks under this policy; skipped checks have no result."""
+        first, gated = self.plan(names)
+        results: List[QCResult] = []
+        self._run_pass(first, calls, max_concurrency, results)
+        if gated and not any(r.score == 0 for r in results):
+            self._run_pass(gated, calls, max_concurrency, results)
+        return results
@@ -3,7 +3,11 @@
 from string import Template
 
 class QualityCheckPrompts:
-    """Templates for quality check prompts."""
+    """Templates for quality check prompts.
+
+    Checks that need the article receive it through ``ARTICLE_PREFIX``, sent
+    as a cached prompt prefix, rather than inside the check template.
+    """
     
     CLARITY = Template("""
     As an AP assessment expert, evaluate this question's clarity:
@@ -49,12 +53,17 @@ class QualityCheckPrompts:
     }
     """)
     
+    ARTICLE_PREFIX = Template("""
+    Reference article for the evaluation that follows:
+    
+    ${article}
+    """)
+    
     CONTENT = Template("""
-    As an AP assessment expert, evaluate this question's content:
+    As an AP assessment expert, evaluate this question's content against the reference article:
     
     Question: ${question}
     Responses: ${responses}
-    Article: ${article}
     EK Code: ${ek_code}
     LO Code: ${lo_code}
     
@@ -97,3 +106,46 @@ class QualityCheckPrompts:
         "feedback": "2-line actionable feedback"
     }
     """)
+    
+    COMBINED = Template("""
+    As an AP assessment expert, evaluate this question against each criterion below:
+    
+    Question: ${question}
+    Responses: ${responses}
+    EK Code: ${ek_code}
+    LO Code: ${lo_code}
+    
+    ${criteria}
+    
+    Score each criterion 1 if ALL of its conditions are met, 0 if ANY is not met.
+    
+    Format response as JSON with one entry per criterion (${names}):
+    {
+        "<criterion>": {
+            "score": 0 or 1,
+            "rationale": "2-line explanation",
+            "feedback": "2-line actionable feedback"
+        }
+    }
+    """)
+    
+    COMBINED_CRITERIA = {
+        'clarity': """clarity:
+    - Has single, clear interpretation
+    - Provides sufficient context
+    - Uses precise language
+    - Avoids compound questions""",
+        'format': """format:
+    - Has 4-5 answer options
+    - All formulas properly formatted
+    - All referenced materials present
+    - Consistent formatting across options""",
+        'content': """content:
+    - Answerable through critical thinking and article content
+    - Uses correct terminology
+    - Aligns with EK/LO codes
+    - Culturally sensitive and appropriate
+    - Not redundant with other questions""",
+        'difficulty': """difficulty:
+    - Requires more than reading comprehension (recall, analysis or evaluation)"""
+    }
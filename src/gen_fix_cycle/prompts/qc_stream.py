@@ -0,0 +1,76 @@
+"""Streamed quality checks that stop reading once a check passes."""
+
+from dataclasses import dataclass, field, fields
+import re
+import threading
+import time
+from typing import Dict, Optional
+
+from ..llm import LLMClient, parse_json_text
+from ..models import QCResult, ResponseSchemas
+from ..parsing import parse_qc_response
+
+SCORE_RE = re.compile(r'"score"\s*:\s*"?(\d)')
+
+@dataclass
+class StreamStats:
+    """Latency counters for streamed quality checks, in seconds."""
+    checks: int = 0
+    early_stops: int = 0
+    first_token_seconds: float = 0.0
+    score_seconds: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def add(self, first_token: float, score: Optional[float], early_stop: bool) -> None:
+        """Record one streamed check."""
+        with self._lock:
+            self.checks += 1
+            self.early_stops += int(early_stop)
+            self.first_token_seconds += first_token
+            self.score_seconds += score or 0.0
+
+    def snapshot(self) -> Dict[str, float]:
+        """Return totals plus mean time-to-first-token and time-to-score."""
+        with self._lock:
+            totals = {f.name: getattr(self, f.name) for f in fields(self) if f.name != "_lock"}
+        count = max(1, self.checks)
+        totals["mean_first_token_seconds"] = self.first_token_seconds / count
+        totals["mean_score_seconds"] = self.score_seconds / count
+        return totals
+
+def stream_check(
+    llm: LLMClient,
+    prompt: str,
+    prefix: Optional[str],
+    check_type: str,
+    stats: StreamStats
+) -> QCResult:
+    """Run one check, cancelling the response as soon as it scores a pass.
+
+    Prompts put ``score`` first, so a pass is known after a handful of
+    tokens and its rationale and feedback are never generated. Failing
+    checks are read to the end because their feedback drives the fixer.
+    """
+    start = time.monotonic()
+    first_token = score_time = None
+    text = ""
+    chunks = llm.complete_stream(prompt, prefix)
+    try:
+        for chunk in chunks:
+            if first_token is None:
+                first_token = time.monotonic() - start
+            text += chunk
+            match = SCORE_RE.search(text) if score_time is None else None
+            if match:
+                score_time = time.monotonic() - start
+                if match.group(1) == "1":
+                    stats.add(first_token, score_time, True)
+                    return QCResult(score=1, rationale="", feedback="", check_type=check_type)
+    finally:
+        chunks.close()
+    stats.add(first_token or 0.0, score_time, False)
+
+    data = parse_json_text(text, ResponseSchemas.BASIC)
+    if data is None:
+        data = llm.complete(prompt, prefix=prefix, schema=ResponseSchemas.BASIC)
+    return parse_qc_response(data, check_type)
@@ -0,0 +1,142 @@
+"""Precompiled prompt templates with per-subject static parts rendered once."""
+
+from string import Template
+from typing import Dict, List, Optional, Tuple, Type
+
+from .client_prompts import ClientPrompts
+from .criteria import SubjectCriteria, get_criteria
+from .fix_prompts import FixPrompts
+from .gen_prompts import GenerationPrompts
+from .qc_prompts import QualityCheckPrompts
+
+# Criteria type bound into each template that takes subject criteria
+SUBJECT_CRITERIA = {
+    'gen.mcq_prefix': 'question',
+    'gen.correct_answer': 'correct',
+    'gen.distractors': 'distractor'
+}
+
+class CompiledTemplate:
+    """A ``string.Template`` parsed once into static text and placeholders.
+
+    Rendering fills a precompiled format string instead of re-scanning the
+    template with a regex, and ``bind`` folds known values into the static
+    text.
+    """
+
+    def __init__(self, parts: List[Tuple[bool, str]]):
+        self.parts = parts
+        self.placeholders = {text for is_name, text in parts if is_name}
+        self._format = "".join(
+            "{" + text + "}" if is_name else text.replace("{", "{{").replace("}", "}}")
+            for is_name, text in parts
+        )
+
+    @classmethod
+    def compile(cls, template: Template) -> "CompiledTemplate":
+        parts: List[Tuple[bool, str]] = []
+        text = template.template
+        end = 0
+        for match in template.pattern.finditer(text):
+            literal = text[end:match.start()]
+            name = match.group("named") or match.group("braced")
+            if match.group("escaped") is not None:
+                literal += template.delimiter
+            elif name is None:
+                raise ValueError(f"Invalid placeholder in template at offset {match.start()}")
+            parts.append((False, literal))
+            if name:
+                parts.append((True, name))
+            end = match.end()
+        parts.append((False, text[end:]))
+        return cls(parts).bind()
+
+    def bind(self, **values: str) -> "CompiledTemplate":
+        """Return a template with ``values`` and adjacent static text merged."""
+        parts: List[Tuple[bool, str]] = []
+        for is_name, text in self.parts:
+            if is_name and text in values:
+                is_name, text = False, str(values[text])
+            if not is_name and parts and not parts[-1][0]:
+                parts[-1] = (False, parts[-1][1] + text)
+            elif is_name or text:
+                parts.append((is_name, text))
+        return CompiledTemplate(parts)
+
+    def segments(self, **values: str) -> List[str]:
+        """The prompt as a list of static and substituted segments.
+
+        Raises:
+            KeyError: If a placeholder has no value, as ``substitute`` does
+        """
+        return [str(values[text]) if is_name else text for is_name, text in self.parts]
+
+    def render(self, **values: str) -> str:
+        return self._format.format_map(values)
+
+def _templates(namespace: str, prompts: Type) -> Dict[str, Template]:
+    return {
+        f"{namespace}.{name.lower()}": value
+        for name, value in vars(prompts).items()
+        if isinstance(value, Template)
+    }
+
+class PromptRegistry:
+    """All prompt templates by name, e.g. ``qc.clarity`` or ``gen.mcq``.
+
+    Templates are compiled on construction, and every template taking
+    subject criteria is also pre-rendered for each known subject; other
+    subjects are bound on first use.
+    """
+
+    def __init__(self, templates: Dict[str, Template]):
+        self._compiled = {name: CompiledTemplate.compile(t) for name, t in templates.items()}
+        self._subject: Dict[Tuple[str, str], CompiledTemplate] = {}
+        for subject in SubjectCriteria.MAPPING:
+            for name, criteria_type in SUBJECT_CRITERIA.items():
+                self._subject[(subject, name)] = self._compiled[name].bind(
+                    criteria=get_criteria(subject, criteria_type)
+                )
+
+    def get(self, name: str, subject: Optional[str] = None) -> CompiledTemplate:
+        """Return a compiled template, with criteria bound when ``subject`` is given."""
+        if name not in self._compiled:
+            raise ValueError(f"Unknown prompt: {name}")
+        if subject is None or name not in SUBJECT_CRITERIA:
+            return self._compiled[name]
+        key = (subject, name)
+        if key not in self._subject:
+            self._subject[key] = self._compiled[name].bind(
+                criteria=get_criteria(subject, SUBJECT_CRITERIA[name])
+            )
+        return self._subject[key]
+
+    def render(self, name: str, subject: Optional[str] = None, **values: str) -> str:
+        return self.get(name, subject).render(**values)
+
+    def segments(self, name: str, subject: Optional[str] = None, **values: str) -> List[str]:
+        return self.get(name, subject).segments(**values)
+
+    def assemble(
+        self,
+        prefix: str,
+        name: str,
+        subject: Optional[str] = None,
+        **values: str
+    ) -> Tuple[str, str]:
+        """Build a cacheable prefix and the prompt sent after it.
+
+        Both templates are filled as segment lists from one set of values,
+        each taking the values it names. The prefix is byte-identical for
+        every prompt sharing its values, so the API can reuse its cached copy.
+        """
+        head = self.segments(prefix, subject, **values)
+        body = self.segments(name, subject, **values)
+        return "".join(head), "".join(body)
+
+PROMPTS = PromptRegistry({
+    **_templates('gen', GenerationPrompts),
+    **_templates('qc', QualityCheckPrompts),
+    **_templates('fix', FixPrompts),
+    **_templates('client', ClientPrompts)
+})
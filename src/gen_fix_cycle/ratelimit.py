@@ -0,0 +1,127 @@
+"""Client-side rate limiting, retries and backoff for LLM requests."""
+
+from dataclasses import dataclass
+import random
+import threading
+import time
+from typing import Callable, Optional, TypeVar
+
+from .concurrency import AdaptiveConcurrency
+
+T = TypeVar("T")
+
+THROTTLE_STATUSES = {429, 529}
+RETRYABLE_STATUSES = THROTTLE_STATUSES | {408, 500, 502, 503, 504}
+RETRYABLE_ERRORS = {"APIConnectionError", "APITimeoutError"}
+
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously at ``rate`` per second.
+
+    A request larger than the bucket is charged in full: the bucket goes
+    into debt and the caller waits until it is paid back, so large prompts
+    are paced at ``rate`` rather than at ``capacity`` per request.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, amount: float = 1) -> float:
+        """Take ``amount`` tokens, blocking until the bucket is out of debt; return seconds waited."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= amount
+            wait = max(0.0, -self._tokens / self.rate)
+        if wait:
+            time.sleep(wait)
+        return wait
+
+@dataclass
+class RateLimitStats:
+    """Counters for a RateLimiter."""
+    requests: int = 0
+    retries: int = 0
+    throttled: int = 0
+    throttle_seconds: float = 0.0
+
+def _retry_after(error: Exception) -> Optional[float]:
+    response = getattr(error, "response", None)
+    value = response.headers.get("retry-after") if response is not None else None
+    return float(value) if value and value.replace(".", "", 1).isdigit() else None
+
+class RateLimiter:
+    """Paces, retries and adaptively bounds requests to the API.
+
+    Args:
+        requests_per_minute: Request budget; unlimited when None
+        tokens_per_minute: Estimated input-token budget; unlimited when None
+        burst_seconds: How many seconds of budget may be spent back-to-back
+        max_retries: Retries for throttling, overload and transient errors
+        base_delay: First backoff delay in seconds, doubled per attempt
+        max_delay: Upper bound on a single backoff delay
+        concurrency: AIMD in-flight limit, shrunk whenever a call is throttled
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        burst_seconds: float = 1.0,
+        max_retries: int = 5,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+        concurrency: Optional[AdaptiveConcurrency] = None
+    ):
+        self.requests = TokenBucket(
+            requests_per_minute / 60, max(1.0, requests_per_minute / 60 * burst_seconds)
+        ) if requests_per_minute else None
+        self.tokens = TokenBucket(
+            tokens_per_minute / 60, max(1.0, tokens_per_minute / 60 * burst_seconds)
+        ) if tokens_per_minute else None
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.concurrency = concurrency or AdaptiveConcurrency()
+        self.stats = RateLimitStats()
+        self._lock = threading.Lock()
+
+    def _count(self, **deltas: float) -> None:
+        with self._lock:
+            for name, delta in deltas.items():
+                setattr(self.stats, name, getattr(self.stats, name) + delta)
+
+    def call(self, send: Callable[[], T], tokens: int = 0) -> T:
+        """Run ``send`` within the budgets, retrying with jittered backoff.
+
+        A ``retry-after`` header on the error overrides the computed delay.
+        """
+        attempt = 0
+        while True:
+            waited = self.requests.acquire() if self.requests else 0.0
+            waited += self.tokens.acquire(tokens) if self.tokens and tokens else 0.0
+            self._count(requests=1, throttle_seconds=waited)
+            with self.concurrency.slot():
+                try:
+                    result = send()
+                except Exception as e:
+                    status = getattr(e, "status_code", None)
+                    retryable = status in RETRYABLE_STATUSES or type(e).__name__ in RETRYABLE_ERRORS
+                    if not retryable or attempt >= self.max_retries:
+                        raise
+                    if status in THROTTLE_STATUSES:
+                        self.concurrency.on_throttle()
+                        self._count(throttled=1)
+                    delay = _retry_after(e)
+                    if delay is None:
+                        delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+                else:
+                    self.concurrency.on_success()
+                    return result
+            attempt += 1
+            self._count(retries=1, throttle_seconds=delay)
+            time.sleep(delay)
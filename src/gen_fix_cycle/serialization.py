@@ -0,0 +1,33 @@
+"""JSON-safe conversion of data models for persistence."""
+
+from dataclasses import asdict
+from typing import Any, Dict
+
+from .models import Difficulty, QCResult, Question, QuestionType, Response
+
+def question_to_dict(question: Question) -> Dict[str, Any]:
+    """Convert a Question to plain JSON-serialisable data."""
+    data = asdict(question)
+    data["question_type"] = question.question_type.name
+    data["difficulty"] = question.difficulty.name
+    return data
+
+def question_from_dict(data: Dict[str, Any]) -> Question:
+    """Rebuild a Question produced by ``question_to_dict``."""
+    return Question(
+        text=data["text"],
+        responses=[Response(**r) for r in data["responses"]],
+        question_type=QuestionType[data["question_type"]],
+        difficulty=Difficulty[data["difficulty"]],
+        ek_code=data.get("ek_code"),
+        lo_code=data.get("lo_code"),
+        skill_code=data.get("skill_code")
+    )
+
+def qc_result_to_dict(result: QCResult) -> Dict[str, Any]:
+    """Convert a QCResult to plain JSON-serialisable data."""
+    return asdict(result)
+
+def qc_result_from_dict(data: Dict[str, Any]) -> QCResult:
+    """Rebuild a QCResult produced by ``qc_result_to_dict``."""
+    return QCResult(**data)
@@ -0,0 +1,21 @@
+"""Streaming Messages API requests."""
+
+from contextlib import closing
+from typing import Any, Iterator
+
+from .usage import UsageStats
+
+def stream_text(events: Any, usage: UsageStats) -> Iterator[str]:
+    """Yield the text deltas of a stream opened with ``stream=True``.
+
+    Closing the generator early closes the HTTP stream, which cancels the
+    rest of the generation.
+    """
+    with closing(events):
+        for event in events:
+            if event.type == "message_start":
+                usage.add(event.message.usage)
+            elif event.type == "message_delta":
+                usage.add_output(event.usage.output_tokens)
+            elif event.type == "content_block_delta" and event.delta.type == "text_delta":
+                yield event.delta.text
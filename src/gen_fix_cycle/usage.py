@@ -0,0 +1,38 @@
+"""Token usage accounting across LLM requests."""
+
+from dataclasses import dataclass, field, fields
+import threading
+from typing import Any, Dict
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (about four characters per token)."""
+    return len(text) // 4 + 1
+
+@dataclass
+class UsageStats:
+    """Running token totals, including prompt-cache reads and writes."""
+    requests: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_creation_input_tokens: int = 0
+    cache_read_input_tokens: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def add(self, usage: Any) -> None:
+        """Add the ``usage`` block of a Messages API response."""
+        with self._lock:
+            self.requests += 1
+            self.input_tokens += getattr(usage, "input_tokens", 0) or 0
+            self.output_tokens += getattr(usage, "output_tokens", 0) or 0
+            self.cache_creation_input_tokens += getattr(usage, "cache_creation_input_tokens", 0) or 0
+            self.cache_read_input_tokens += getattr(usage, "cache_read_input_tokens", 0) or 0
+
+    def add_output(self, output_tokens: int) -> None:
+        """Add output tokens reported after the fact, e.g. by a stream."""
+        with self._lock:
+            self.output_tokens += output_tokens or 0
+
+    def snapshot(self) -> Dict[str, int]:
+        """Return the current totals as a plain dict."""
+        with self._lock:
+            return {f.name: getattr(self, f.name) for f in fields(self) if f.name != "_lock"}
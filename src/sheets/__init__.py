@@ -1,4 +1,7 @@
+from .cache import SheetsReadCache
 from .client import GoogleSheetsClient
+from .pool import GoogleSheetsClientPool
+from .sink import SheetsResultSink
 from .models import (
     SheetRange,
     SheetReadRequest,
@@ -9,6 +12,9 @@ from .models import (
 
 __all__ = [
     "GoogleSheetsClient",
+    "GoogleSheetsClientPool",
+    "SheetsResultSink",
+    "SheetsReadCache",
     "SheetRange",
     "SheetReadRequest",
     "SheetReadResponse",
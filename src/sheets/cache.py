@@ -0,0 +1,92 @@
+from dataclasses import asdict, dataclass
+import json
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional
+
+@dataclass
+class CachedRange:
+    values: List[List[str]]
+    range: str
+    modified_time: Optional[str]
+    stored_at: float
+
+@dataclass
+class SheetsCacheStats:
+    hits: int = 0
+    validated_hits: int = 0
+    misses: int = 0
+
+class SheetsReadCache:
+    """Cache of range reads kept in memory and, with ``path``, in SQLite.
+
+    Entries younger than ``ttl`` seconds are served as they are. Older
+    entries, or all of them when ``ttl`` is None, are served only while the
+    spreadsheet's Drive ``modifiedTime`` is unchanged if ``validate`` is
+    set, and refetched otherwise.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttl: Optional[float] = None,
+        validate: bool = True,
+    ) -> None:
+        self.ttl = ttl
+        self.validate = validate
+        self.stats = SheetsCacheStats()
+        self._memory: Dict[str, CachedRange] = {}
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False) if path else None
+        if self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS ranges ("
+                "key TEXT PRIMARY KEY, spreadsheet_id TEXT, entry TEXT)"
+            )
+
+    @staticmethod
+    def key(spreadsheet_id: str, range_str: str, major_dimension: str) -> str:
+        return json.dumps([spreadsheet_id, range_str, major_dimension])
+
+    def fresh(self, entry: CachedRange) -> bool:
+        """Whether ``entry`` may be served without checking Drive."""
+        return self.ttl is not None and time.time() - entry.stored_at <= self.ttl
+
+    def get(self, key: str) -> Optional[CachedRange]:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None and self._db:
+                row = self._db.execute("SELECT entry FROM ranges WHERE key = ?", (key,)).fetchone()
+                if row:
+                    entry = self._memory[key] = CachedRange(**json.loads(row[0]))
+            return entry
+
+    def put(self, key: str, spreadsheet_id: str, entry: CachedRange) -> None:
+        with self._lock:
+            self._memory[key] = entry
+            if self._db:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO ranges VALUES (?, ?, ?)",
+                    (key, spreadsheet_id, json.dumps(asdict(entry))),
+                )
+                self._db.commit()
+
+    def invalidate(self, spreadsheet_id: str) -> None:
+        """Drop every entry of a spreadsheet, e.g. after writing to it."""
+        with self._lock:
+            prefix = json.dumps([spreadsheet_id])[:-1] + ","
+            for key in [k for k in self._memory if k.startswith(prefix)]:
+                del self._memory[key]
+            if self._db:
+                self._db.execute("DELETE FROM ranges WHERE spreadsheet_id = ?", (spreadsheet_id,))
+                self._db.commit()
+
+    def record(self, *counters: str) -> None:
+        with self._lock:
+            for name in counters:
+                setattr(self.stats, name, getattr(self.stats, name) + 1)
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return asdict(self.stats)
@@ -1,9 +1,10 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List
-
-from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, TypeVar
 
+from .cache import CachedRange, SheetsReadCache
+from .diff import cell_name, changed_cells, coalesce, parse_cell
 from .models import (
     SheetRange,
     SheetReadRequest,
@@ -12,17 +13,80 @@ from .models import (
     SheetWriteResponse,
 )
 
+if TYPE_CHECKING:
+    from google.oauth2.credentials import Credentials
+
+R = TypeVar("R")
+
 class GoogleSheetsClient:
-    def __init__(self, credentials: Credentials) -> None:
-        # Type hint as Any since the service object structure is dynamic
-        self.service: Any = build("sheets", "v4", credentials=credentials)
+    def __init__(
+        self,
+        credentials: Optional["Credentials"] = None,
+        max_ranges_per_call: int = 100,
+        max_cells_per_call: int = 50000,
+        service: Optional[Any] = None,
+        cache: Optional[SheetsReadCache] = None,
+        drive_service: Optional[Any] = None,
+    ) -> None:
+        needs_drive = cache is not None and cache.validate and drive_service is None
+        if service is None or needs_drive:
+            # Deferred so importing the package does not load the discovery client
+            from googleapiclient.discovery import build
+            if service is None:
+                service = build("sheets", "v4", credentials=credentials)
+            if needs_drive:
+                drive_service = build("drive", "v3", credentials=credentials)
+
+        # Type hint as Any since the service object structure is dynamic;
+        # tests may pass any object with the same surface as ``service``
+        self.service: Any = service
+        # Batch calls are split to stay well inside request size and quota limits
+        self.max_ranges_per_call = max_ranges_per_call
+        self.max_cells_per_call = max_cells_per_call
+        # Reads go through ``cache`` when given; Drive metadata validates entries
+        self.cache = cache
+        self.drive_service: Any = drive_service
 
     def _format_range(self, range_obj: SheetRange) -> str:
         if range_obj.end_cell:
             return f"'{range_obj.sheet_name}'!{range_obj.start_cell}:{range_obj.end_cell}"
         return f"'{range_obj.sheet_name}'!{range_obj.start_cell}"
 
+    def _modified_time(self, spreadsheet_id: str) -> str:
+        result: Dict[str, Any] = self.drive_service.files().get(
+            fileId=spreadsheet_id,
+            fields="modifiedTime",
+        ).execute()
+        return result["modifiedTime"]
+
     def read(self, request: SheetReadRequest) -> SheetReadResponse:
+        if self.cache is None:
+            return self._fetch(request)
+
+        range_str = self._format_range(request.range)
+        key = self.cache.key(request.spreadsheet_id, range_str, request.major_dimension)
+        entry = self.cache.get(key)
+        if entry and self.cache.fresh(entry):
+            self.cache.record("hits")
+            return SheetReadResponse(values=entry.values, timestamp=datetime.now(), range=entry.range)
+
+        modified = self._modified_time(request.spreadsheet_id) if self.cache.validate else None
+        if entry and modified is not None and entry.modified_time == modified:
+            self.cache.record("hits", "validated_hits")
+            entry.stored_at = time.time()
+            self.cache.put(key, request.spreadsheet_id, entry)
+            return SheetReadResponse(values=entry.values, timestamp=datetime.now(), range=entry.range)
+
+        self.cache.record("misses")
+        response = self._fetch(request)
+        self.cache.put(
+            key,
+            request.spreadsheet_id,
+            CachedRange(response.values, response.range, modified, time.time()),
+        )
+        return response
+
+    def _fetch(self, request: SheetReadRequest) -> SheetReadResponse:
         range_str = self._format_range(request.range)
         result: Dict[str, Any] = self.service.spreadsheets().values().get(
             spreadsheetId=request.spreadsheet_id,
@@ -36,6 +100,37 @@ class GoogleSheetsClient:
             range=result["range"],
         )
 
+    def iter_rows(
+        self,
+        spreadsheet_id: str,
+        sheet_name: str,
+        chunk_rows: int = 1000,
+        first_row: int = 1,
+    ) -> Iterator[List[str]]:
+        """Yield the rows of a sheet, reading ``chunk_rows`` rows per request.
+
+        The next window is fetched on a background thread while the caller
+        works through the current one, so at most two chunks are held in
+        memory. Iteration ends at the first window with no values; the
+        client should not be used from other threads until it does. Windows
+        are read straight from the API, bypassing the read cache.
+        """
+        def fetch(start: int) -> List[List[str]]:
+            window = SheetRange(sheet_name, str(start), str(start + chunk_rows - 1))
+            return self._fetch(SheetReadRequest(spreadsheet_id, window)).values
+
+        with ThreadPoolExecutor(max_workers=1) as prefetch:
+            start = first_row
+            pending = prefetch.submit(fetch, start)
+            while True:
+                rows = pending.result()
+                if not rows:
+                    return
+                start += chunk_rows
+                pending = prefetch.submit(fetch, start)
+                yield from rows
+                del rows
+
     def write(self, request: SheetWriteRequest) -> SheetWriteResponse:
         range_str = self._format_range(request.range)
         body = {
@@ -43,6 +138,7 @@ class GoogleSheetsClient:
             "majorDimension": request.major_dimension,
         }
         
+        self._invalidate(request.spreadsheet_id)
         result: Dict[str, Any] = self.service.spreadsheets().values().update(
             spreadsheetId=request.spreadsheet_id,
             range=range_str,
@@ -57,3 +153,166 @@ class GoogleSheetsClient:
             updated_cells=result["updatedCells"],
             timestamp=datetime.now(),
         )
+
+    def write_diff(self, request: SheetWriteRequest) -> SheetWriteResponse:
+        """Write only the cells whose values differ from what the sheet holds.
+
+        Current values are read through the cache when one is configured.
+        Changed cells are grouped into rectangles and sent with one
+        batchUpdate; ``updated_cells`` counts the cells actually sent.
+        """
+        values = request.values
+        if request.major_dimension == "COLUMNS":
+            height = max(map(len, values), default=0)
+            values = [[col[r] if r < len(col) else "" for col in values] for r in range(height)]
+        row0, col0 = parse_cell(request.range.start_cell)
+        height = len(values)
+        width = max(map(len, values), default=0)
+        requested = sum(len(row) for row in values)
+        target = SheetRange(
+            request.range.sheet_name,
+            request.range.start_cell,
+            cell_name(row0 + max(height, 1) - 1, col0 + max(width, 1) - 1),
+        )
+
+        current = self.read(SheetReadRequest(request.spreadsheet_id, target)).values
+        changed = changed_cells(current, values)
+        rects = coalesce(changed)
+        self.batch_write([
+            SheetWriteRequest(
+                request.spreadsheet_id,
+                SheetRange(
+                    request.range.sheet_name,
+                    cell_name(row0 + top, col0 + left),
+                    cell_name(row0 + bottom, col0 + right),
+                ),
+                [row[left:right + 1] for row in values[top:bottom + 1]],
+            )
+            for top, left, bottom, right in rects
+        ])
+
+        return SheetWriteResponse(
+            updated_range=self._format_range(target),
+            updated_rows=len({r for r, _ in changed}),
+            updated_columns=len({c for _, c in changed}),
+            updated_cells=len(changed),
+            timestamp=datetime.now(),
+            requested_cells=requested,
+        )
+
+    def append(self, request: SheetWriteRequest) -> SheetWriteResponse:
+        """Append rows after the last row of the table at ``request.range``."""
+        self._invalidate(request.spreadsheet_id)
+        result: Dict[str, Any] = self.service.spreadsheets().values().append(
+            spreadsheetId=request.spreadsheet_id,
+            range=self._format_range(request.range),
+            valueInputOption="RAW",
+            insertDataOption="INSERT_ROWS",
+            body={"values": request.values, "majorDimension": request.major_dimension},
+        ).execute()
+
+        updates = result["updates"]
+        return SheetWriteResponse(
+            updated_range=updates["updatedRange"],
+            updated_rows=updates.get("updatedRows", 0),
+            updated_columns=updates.get("updatedColumns", 0),
+            updated_cells=updates.get("updatedCells", 0),
+            timestamp=datetime.now(),
+        )
+
+    def _invalidate(self, spreadsheet_id: str) -> None:
+        if self.cache:
+            self.cache.invalidate(spreadsheet_id)
+
+    def _chunks(
+        self,
+        requests: List[R],
+        key: Callable[[R], Any],
+        cells: Callable[[R], int],
+    ) -> Iterator[List[int]]:
+        """Group request indexes by ``key`` and split each group into calls."""
+        groups: Dict[Any, List[int]] = {}
+        for i, request in enumerate(requests):
+            groups.setdefault(key(request), []).append(i)
+
+        for indexes in groups.values():
+            chunk: List[int] = []
+            chunk_cells = 0
+            for i in indexes:
+                size = cells(requests[i])
+                full = len(chunk) >= self.max_ranges_per_call
+                if chunk and (full or chunk_cells + size > self.max_cells_per_call):
+                    yield chunk
+                    chunk, chunk_cells = [], 0
+                chunk.append(i)
+                chunk_cells += size
+            if chunk:
+                yield chunk
+
+    def batch_read(self, requests: List[SheetReadRequest]) -> List[SheetReadResponse]:
+        """Read many ranges with one batchGet per spreadsheet and dimension.
+
+        Responses are returned in the order of ``requests``.
+        """
+        responses: List[Optional[SheetReadResponse]] = [None] * len(requests)
+        chunks = self._chunks(
+            requests,
+            key=lambda r: (r.spreadsheet_id, r.major_dimension),
+            cells=lambda r: 0,
+        )
+        for chunk in chunks:
+            first = requests[chunk[0]]
+            result: Dict[str, Any] = self.service.spreadsheets().values().batchGet(
+                spreadsheetId=first.spreadsheet_id,
+                ranges=[self._format_range(requests[i].range) for i in chunk],
+                majorDimension=first.major_dimension,
+            ).execute()
+
+            timestamp = datetime.now()
+            for i, value_range in zip(chunk, result["valueRanges"]):
+                responses[i] = SheetReadResponse(
+                    values=value_range.get("values", []),
+                    timestamp=timestamp,
+                    range=value_range["range"],
+                )
+        return responses  # type: ignore[return-value]
+
+    def batch_write(self, requests: List[SheetWriteRequest]) -> List[SheetWriteResponse]:
+        """Write many ranges with one batchUpdate per spreadsheet.
+
+        Responses are returned in the order of ``requests``.
+        """
+        responses: List[Optional[SheetWriteResponse]] = [None] * len(requests)
+        chunks = self._chunks(
+            requests,
+            key=lambda r: r.spreadsheet_id,
+            cells=lambda r: sum(len(row) for row in r.values),
+        )
+        for chunk in chunks:
+            body = {
+                "valueInputOption": "RAW",
+                "data": [
+                    {
+                        "range": self._format_range(requests[i].range),
+                        "values": requests[i].values,
+                        "majorDimension": requests[i].major_dimension,
+                    }
+                    for i in chunk
+                ],
+            }
+            self._invalidate(requests[chunk[0]].spreadsheet_id)
+            result: Dict[str, Any] = self.service.spreadsheets().values().batchUpdate(
+                spreadsheetId=requests[chunk[0]].spreadsheet_id,
+                body=body,
+            ).execute()
+
+            timestamp = datetime.now()
+            for i, update in zip(chunk, result.get("responses", [])):
+                responses[i] = SheetWriteResponse(
+                    updated_range=update["updatedRange"],
+                    updated_rows=update.get("updatedRows", 0),
+                    updated_columns=update.get("updatedColumns", 0),
+                    updated_cells=update.get("updatedCells", 0),
+                    timestamp=timestamp,
+                )
+        return responses  # type: ignore[return-value]
@@ -0,0 +1,74 @@
+import re
+from typing import List, Set, Tuple
+
+CELL_RE = re.compile(r"^([A-Za-z]+)(\d+)$")
+
+Rect = Tuple[int, int, int, int]  # first row, first column, last row, last column
+
+def column_index(letters: str) -> int:
+    index = 0
+    for ch in letters.upper():
+        index = index * 26 + ord(ch) - ord("A") + 1
+    return index - 1
+
+def column_letters(index: int) -> str:
+    letters = ""
+    index += 1
+    while index:
+        index, rem = divmod(index - 1, 26)
+        letters = chr(ord("A") + rem) + letters
+    return letters
+
+def parse_cell(cell: str) -> Tuple[int, int]:
+    """Return the zero-based (row, column) of an A1 cell such as ``B3``."""
+    match = CELL_RE.match(cell)
+    if not match:
+        raise ValueError(f"Expected a single A1 cell, got: {cell}")
+    return int(match.group(2)) - 1, column_index(match.group(1))
+
+def cell_name(row: int, column: int) -> str:
+    return f"{column_letters(column)}{row + 1}"
+
+def changed_cells(current: List[List[str]], values: List[List[str]]) -> Set[Tuple[int, int]]:
+    """Positions, relative to the range start, whose new value differs."""
+    changed = set()
+    for r, row in enumerate(values):
+        old_row = current[r] if r < len(current) else []
+        for c, value in enumerate(row):
+            old = old_row[c] if c < len(old_row) else ""
+            if str(value) != str(old):
+                changed.add((r, c))
+    return changed
+
+def coalesce(cells: Set[Tuple[int, int]]) -> List[Rect]:
+    """Cover ``cells`` exactly with few rectangles.
+
+    Each row's changed cells are split into runs of adjacent columns, and a
+    run is merged into the rectangle above it when that spans the same
+    columns and ends on the previous row.
+    """
+    open_rects = {}
+    rects: List[Rect] = []
+    for r in sorted({row for row, _ in cells}):
+        columns = sorted(c for row, c in cells if row == r)
+        runs = []
+        start = prev = columns[0]
+        for c in columns[1:]:
+            if c != prev + 1:
+                runs.append((start, prev))
+                start = c
+            prev = c
+        runs.append((start, prev))
+
+        next_open = {}
+        for run in runs:
+            rect = open_rects.pop(run, None)
+            if rect and rect[2] == r - 1:
+                next_open[run] = (rect[0], run[0], r, run[1])
+            else:
+                if rect:
+                    rects.append(rect)
+                next_open[run] = (r, run[0], r, run[1])
+        rects.extend(open_rects.values())
+        open_rects = next_open
+    return rects + list(open_rects.values())
@@ -34,3 +34,5 @@ class SheetWriteResponse:
     updated_columns: int
     updated_cells: int
     timestamp: datetime
+    # Cells the caller asked to write; set when fewer were actually sent
+    requested_cells: Optional[int] = None
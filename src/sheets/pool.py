@@ -0,0 +1,118 @@
+from concurrent.futures import ThreadPoolExecutor
+import json
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+from .cache import SheetsReadCache
+from .client import GoogleSheetsClient
+from .models import SheetReadRequest, SheetReadResponse
+
+if TYPE_CHECKING:
+    from google.oauth2.credentials import Credentials
+
+class GoogleSheetsClientPool:
+    """Hands out one GoogleSheetsClient per thread over shared settings.
+
+    googleapiclient services and their httplib2 transports are not
+    thread-safe, so each thread gets its own, built from discovery
+    documents parsed once per pool instead of once per ``build()``. All
+    clients share ``cache``. ``service_factory(api, version)`` replaces
+    the real service builder, e.g. with fakes in tests.
+
+    ``read_many`` runs on worker threads that live as long as the pool, so
+    their clients are reused across calls; ``close()`` (or leaving a
+    ``with`` block) shuts them down.
+    """
+
+    def __init__(
+        self,
+        credentials: Optional["Credentials"] = None,
+        max_workers: int = 8,
+        cache: Optional[SheetsReadCache] = None,
+        service_factory: Optional[Callable[[str, str], Any]] = None,
+    ) -> None:
+        self.credentials = credentials
+        self.max_workers = max_workers
+        self.cache = cache
+        self.service_factory = service_factory or self._build
+        self._documents: Dict[str, Dict[str, Any]] = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._closed = False
+
+    def _document(self, api: str, version: str) -> Dict[str, Any]:
+        with self._lock:
+            key = f"{api}.{version}"
+            if key not in self._documents:
+                from googleapiclient.discovery_cache import get_static_doc
+                document = get_static_doc(api, version)
+                if document is None:
+                    raise ValueError(f"No bundled discovery document for {key}")
+                self._documents[key] = json.loads(document)
+            return self._documents[key]
+
+    def _build(self, api: str, version: str) -> Any:
+        from google_auth_httplib2 import AuthorizedHttp
+        from googleapiclient.discovery import build_from_document
+        import httplib2
+
+        http = AuthorizedHttp(self.credentials, http=httplib2.Http())
+        return build_from_document(self._document(api, version), http=http)
+
+    def client(self) -> GoogleSheetsClient:
+        """Return the calling thread's client, creating it on first use."""
+        client = getattr(self._local, "client", None)
+        if client is None:
+            validate = self.cache is not None and self.cache.validate
+            client = self._local.client = GoogleSheetsClient(
+                service=self.service_factory("sheets", "v4"),
+                cache=self.cache,
+                drive_service=self.service_factory("drive", "v3") if validate else None,
+            )
+        return client
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._closed:
+                raise ValueError("Client pool is closed")
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=max(1, self.max_workers),
+                    thread_name_prefix="sheets-pool",
+                )
+            return self._executor
+
+    def read_many(self, requests: List[SheetReadRequest]) -> List[SheetReadResponse]:
+        """Read ranges from many spreadsheets concurrently.
+
+        Requests are grouped per spreadsheet, each group is fetched with
+        ``batch_read`` on one of at most ``max_workers`` threads, and the
+        responses come back in the order of ``requests``.
+        """
+        groups: Dict[str, List[int]] = {}
+        for i, request in enumerate(requests):
+            groups.setdefault(request.spreadsheet_id, []).append(i)
+
+        def fetch(indexes: List[int]) -> List[SheetReadResponse]:
+            return self.client().batch_read([requests[i] for i in indexes])
+
+        responses: List[Optional[SheetReadResponse]] = [None] * len(requests)
+        for indexes, results in zip(groups.values(), self._pool().map(fetch, groups.values())):
+            for i, response in zip(indexes, results):
+                responses[i] = response
+        return responses  # type: ignore[return-value]
+
+    def close(self) -> None:
+        """Shut down the worker threads; later ``read_many`` calls raise."""
+        with self._lock:
+            self._closed = True
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def __enter__(self) -> "GoogleSheetsClientPool":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
@@ -0,0 +1,145 @@
+import threading
+import time
+from typing import TYPE_CHECKING, Any, List, Optional
+
+from .client import GoogleSheetsClient
+from .models import SheetRange, SheetWriteRequest
+
+if TYPE_CHECKING:
+    from gen_fix_cycle.models import GenerationCycle
+
+COLUMNS = [
+    "cycle_id", "status", "question", "correct_answer", "distractors",
+    "ek_code", "lo_code", "difficulty", "qc_scores", "qc_feedback",
+]
+
+def cycle_row(cycle: "GenerationCycle") -> List[str]:
+    """Flatten a cycle into one row matching ``COLUMNS``."""
+    question = cycle.final_question or cycle.original_question
+    correct = [r.text for r in question.responses if r.is_correct]
+    return [
+        cycle.cycle_id or "",
+        cycle.status,
+        question.text,
+        correct[0] if correct else "",
+        "\n".join(r.text for r in question.responses if not r.is_correct),
+        question.ek_code or "",
+        question.lo_code or "",
+        question.difficulty.name,
+        " ".join(f"{r.check_type or 'check'}:{r.score}" for r in cycle.qc_results),
+        "\n".join(r.feedback for r in cycle.qc_results if r.score == 0 and r.feedback),
+    ]
+
+class SheetsResultSink:
+    """Write-behind buffer appending cycle results to a sheet in batches.
+
+    ``add`` only queues a row; a background thread appends everything queued
+    in one call once ``flush_rows`` rows are waiting or the oldest has waited
+    ``flush_interval`` seconds. ``add`` blocks while ``max_buffer`` rows are
+    queued or being written. A failed write is raised by the next ``add``,
+    ``flush`` or ``close``; adding after ``close`` raises ValueError.
+    """
+
+    def __init__(
+        self,
+        client: GoogleSheetsClient,
+        spreadsheet_id: str,
+        sheet_name: str,
+        flush_rows: int = 50,
+        flush_interval: float = 5.0,
+        max_buffer: int = 500,
+    ) -> None:
+        self.client = client
+        self.range = SheetRange(sheet_name, "A1")
+        self.spreadsheet_id = spreadsheet_id
+        self.flush_rows = flush_rows
+        self.flush_interval = flush_interval
+        self.max_buffer = max_buffer
+        self.rows_written = 0
+        self.flushes = 0
+        self._rows: List[List[str]] = []
+        self._oldest = 0.0
+        self._in_flight = 0
+        self._flush_requested = False
+        self._closed = False
+        self._error: Optional[BaseException] = None
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def add(self, cycle: "GenerationCycle") -> None:
+        """Queue a cycle's row, waiting while the buffer is full."""
+        row = cycle_row(cycle)
+        with self._cond:
+            while (len(self._rows) + self._in_flight >= self.max_buffer
+                   and not self._error and not self._closed):
+                self._cond.wait()
+            self._raise_error()
+            if self._closed:
+                raise ValueError("Result sink is closed")
+            if not self._rows:
+                self._oldest = time.monotonic()
+            self._rows.append(row)
+            if len(self._rows) == 1 or len(self._rows) >= self.flush_rows:
+                self._cond.notify_all()
+
+    def flush(self) -> None:
+        """Block until every queued row has been written."""
+        with self._cond:
+            self._flush_requested = True
+            self._cond.notify_all()
+            while (self._rows or self._in_flight) and not self._error:
+                self._cond.wait()
+            self._raise_error()
+
+    def close(self) -> None:
+        """Write what is queued and stop the background thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+        self._raise_error()
+
+    def _raise_error(self) -> None:
+        if self._error:
+            raise RuntimeError("Writing results to Sheets failed") from self._error
+
+    def _take(self) -> List[List[str]]:
+        with self._cond:
+            while True:
+                wait = self._oldest + self.flush_interval - time.monotonic() if self._rows else None
+                due = self._flush_requested or self._closed or len(self._rows) >= self.flush_rows
+                if self._rows and (due or wait <= 0):
+                    rows, self._rows = self._rows, []
+                    self._in_flight = len(rows)
+                    self._flush_requested = False
+                    return rows
+                if self._closed:
+                    return []
+                self._flush_requested = False
+                self._cond.wait(wait)
+
+    def _run(self) -> None:
+        while True:
+            rows = self._take()
+            if not rows:
+                return
+            try:
+                self.client.append(SheetWriteRequest(self.spreadsheet_id, self.range, rows))
+            except Exception as e:
+                with self._cond:
+                    self._error = e
+                    self._in_flight = 0
+                    self._cond.notify_all()
+                return
+            with self._cond:
+                self.rows_written += len(rows)
+                self.flushes += 1
+                self._in_flight = 0
+                self._cond.notify_all()
+
+    def __enter__(self) -> "SheetsResultSink":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
@@ -0,0 +1,85 @@
+"""Stand-ins for ``LLMClient`` and the Anthropic client it wraps."""
+
+import json
+import re
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional
+
+CHECK_RE = re.compile(r"evaluate this question's (\w+)")
+
+QUESTION = {
+    "text": "Analyze why X?",
+    "correct_answer": "Because of A and B",
+    "distractors": ["Always C", "D reason here", "E reason here"],
+    "explanation": "e",
+    "ek_code": "EK1",
+    "lo_code": "LO1"
+}
+
+class FakeLLM:
+    """Scores every check 1 unless ``fails(check, prompt)``; sleeps ``delays[check]``."""
+
+    def __init__(
+        self,
+        delays: Optional[Dict[str, float]] = None,
+        fails: Optional[Callable[[str, str], bool]] = None
+    ):
+        self.delays = delays or {}
+        self.fails = fails or (lambda check, prompt: False)
+        self.calls: List[str] = []
+        self._lock = threading.Lock()
+
+    def complete(self, prompt: str, prefix: Optional[str] = None, schema: Any = None) -> Dict[str, Any]:
+        match = CHECK_RE.search(prompt)
+        kind = match.group(1) if match else (
+            "generate" if "multiple choice" in prompt else
+            "fix_difficulty" if "revised_question" in prompt and "revised_responses" in prompt else
+            "fix_clarity" if "revised_question" in prompt else
+            "fix_responses"
+        )
+        with self._lock:
+            self.calls.append(kind)
+        time.sleep(self.delays.get(kind, 0))
+        if kind == "generate":
+            return {"questions": [dict(QUESTION)]}
+        if kind == "fix_clarity":
+            return {"revised_question": QUESTION["text"].replace("?", " happened?"), "explanation": "x"}
+        if kind == "fix_responses":
+            return {
+                "revised_responses": {
+                    "correct": "Because of A",
+                    "distractors": ["Because of C", "Because of D", "Because of E"]
+                },
+                "explanation": "x"
+            }
+        return {"score": 0 if self.fails(kind, prompt) else 1, "rationale": "r", "feedback": "f"}
+
+    def complete_stream(self, prompt: str, prefix: Optional[str] = None):
+        yield json.dumps(self.complete(prompt, prefix))
+
+def message(text, usage=None):
+    usage = usage or SimpleNamespace(input_tokens=10, output_tokens=5)
+    return SimpleNamespace(content=[SimpleNamespace(text=text)], usage=usage)
+
+def events(text, size=8):
+    for i in range(0, len(text), size):
+        yield SimpleNamespace(type="content_block_delta", delta=SimpleNamespace(type="text_delta", text=text[i:i + size]))
+
+class FakeMessages:
+    """Replies with ``replies`` in turn, as a stream when asked for one.
+
+    ``usage`` optionally lists the usage block of each non-streamed reply.
+    """
+
+    def __init__(self, *replies, usage=None):
+        self.replies = list(replies)
+        self.usage = list(usage or [])
+        self.requests = []
+        self.messages = self
+
+    def create(self, stream=False, **params):
+        self.requests.append(dict(params, stream=stream))
+        text = self.replies.pop(0)
+        return events(text) if stream else message(text, self.usage.pop(0) if self.usage else None)
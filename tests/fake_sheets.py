@@ -0,0 +1,89 @@
+"""In-memory stand-in for the googleapiclient Sheets service."""
+
+import re
+from typing import Any, Dict, List, Tuple
+
+CELL_RE = re.compile(r"([A-Z]*)(\d+)")
+LAST_COLUMN = 25
+
+def _column(letters: str) -> int:
+    index = 0
+    for ch in letters:
+        index = index * 26 + ord(ch) - ord("A") + 1
+    return index - 1
+
+def _bounds(a1: str) -> Tuple[str, int, int, int, int]:
+    sheet, cells = a1.split("!")
+    start, _, end = cells.partition(":")
+    start_col, start_row = CELL_RE.fullmatch(start).groups()
+    end_col, end_row = CELL_RE.fullmatch(end or start).groups()
+    left = _column(start_col) if start_col else 0
+    right = _column(end_col) if end_col else LAST_COLUMN
+    return sheet.strip("'"), int(start_row) - 1, left, int(end_row) - 1, right
+
+class _Call:
+    def __init__(self, result: Any):
+        self.result = result
+
+    def execute(self) -> Any:
+        return self.result
+
+class FakeSheetsService:
+    """Grid per sheet name; records every values() call made."""
+
+    def __init__(self) -> None:
+        self.grids: Dict[str, Dict[Tuple[int, int], str]] = {}
+        self.calls: List[Tuple[str, Any]] = []
+
+    def spreadsheets(self) -> "FakeSheetsService":
+        return self
+
+    def values(self) -> "FakeSheetsService":
+        return self
+
+    def set(self, sheet: str, rows: List[List[str]]) -> None:
+        self.grids[sheet] = {(r, c): v for r, row in enumerate(rows) for c, v in enumerate(row)}
+
+    def _read(self, a1: str) -> List[List[str]]:
+        sheet, top, left, bottom, right = _bounds(a1)
+        grid = self.grids.get(sheet, {})
+        rows = [[grid.get((r, c), "") for c in range(left, right + 1)] for r in range(top, bottom + 1)]
+        rows = [row[:max((i + 1 for i, v in enumerate(row) if v), default=0)] for row in rows]
+        while rows and not rows[-1]:
+            rows.pop()
+        return rows
+
+    def _write(self, a1: str, values: List[List[str]]) -> Dict[str, Any]:
+        sheet, top, left, _, _ = _bounds(a1)
+        grid = self.grids.setdefault(sheet, {})
+        for r, row in enumerate(values):
+            for c, value in enumerate(row):
+                grid[(top + r, left + c)] = value
+        return {
+            "updatedRange": a1,
+            "updatedRows": len(values),
+            "updatedColumns": max(map(len, values), default=0),
+            "updatedCells": sum(map(len, values)),
+        }
+
+    def get(self, spreadsheetId: str, range: str, majorDimension: str = "ROWS") -> _Call:
+        self.calls.append(("get", range))
+        return _Call({"range": range, "values": self._read(range)})
+
+    def batchGet(self, spreadsheetId: str, ranges: List[str], majorDimension: str = "ROWS") -> _Call:
+        self.calls.append(("batchGet", list(ranges)))
+        return _Call({"valueRanges": [{"range": r, "values": self._read(r)} for r in ranges]})
+
+    def batchUpdate(self, spreadsheetId: str, body: Dict[str, Any]) -> _Call:
+        self.calls.append(("batchUpdate", [d["range"] for d in body["data"]]))
+        return _Call({"responses": [self._write(d["range"], d["values"]) for d in body["data"]]})
+
+    def append(self, spreadsheetId: str, range: str, valueInputOption: str,
+               insertDataOption: str, body: Dict[str, Any]) -> _Call:
+        self.calls.append(("append", len(body["values"])))
+        return _Call({"updates": {
+            "updatedRange": range,
+            "updatedRows": len(body["values"]),
+            "updatedColumns": max(map(len, body["values"]), default=0),
+            "updatedCells": sum(map(len, body["values"])),
+        }})
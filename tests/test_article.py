@@ -0,0 +1,21 @@
+from gen_fix_cycle.article import prepare_article
+from gen_fix_cycle.usage import estimate_tokens
+
+ARTICLE = "\n\n".join([
+    "The treaty ended the war and redrew the borders of the region.",
+    "Farmers moved west as railroads opened new markets for grain.",
+    "Tariffs on imported cloth protected the growing textile mills."
+])
+
+def test_excerpt_prefers_relevant_chunks_in_article_order():
+    article = prepare_article(ARTICLE + "\n\n" + " ".join(["filler"] * 400))
+    excerpt = article.excerpt("railroads grain markets", budget=120)
+    assert "railroads" in excerpt
+    assert estimate_tokens(excerpt) <= 120
+
+def test_excerpt_truncates_top_chunk_when_nothing_fits():
+    article = prepare_article(" ".join(["railroads"] * 600))
+    excerpt = article.excerpt("railroads", budget=10)
+    assert excerpt
+    assert estimate_tokens(excerpt) <= 10
+    assert excerpt.split() == ["railroads"] * len(excerpt.split())
@@ -0,0 +1,68 @@
+import asyncio
+from dataclasses import replace
+
+from gen_fix_cycle.async_llm import AsyncLLMClient
+from gen_fix_cycle.cache import ResponseCache
+from gen_fix_cycle.config import LLMConfig
+
+from fake_llm import message
+
+REPLY = '{"score": 1, "rationale": "r", "feedback": "f"}'
+
+class FakeTransport:
+    """Async ``messages.create`` that tracks how many calls overlap."""
+
+    def __init__(self, delay=0.01):
+        self.delay = delay
+        self.messages = self
+        self.requests = []
+        self.in_flight = self.peak = 0
+
+    async def create(self, **params):
+        self.requests.append(params)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        return message(REPLY)
+
+def test_in_flight_calls_are_bounded():
+    transport = FakeTransport()
+
+    async def run():
+        llm = AsyncLLMClient(LLMConfig(), client=transport, max_in_flight=5)
+        return await asyncio.gather(*(llm.complete(f"prompt {i}") for i in range(50)))
+
+    results = asyncio.run(run())
+    assert len(results) == 50 and all(r["score"] == 1 for r in results)
+    assert len(transport.requests) == 50
+    assert transport.peak == 5
+
+def test_with_config_shares_transport_limit_and_usage():
+    transport = FakeTransport()
+
+    async def run():
+        llm = AsyncLLMClient(LLMConfig(), client=transport, max_in_flight=3)
+        other = llm.with_config(replace(LLMConfig(), temperature=0.0))
+        await asyncio.gather(*(c.complete(f"prompt {i}") for i in range(10) for c in (llm, other)))
+        return llm, other
+
+    llm, other = asyncio.run(run())
+    assert other.client is llm.client and other.semaphore is llm.semaphore and other.usage is llm.usage
+    assert other.config.temperature == 0.0
+    assert transport.peak == 3
+    assert llm.usage.snapshot()["requests"] == 20
+    assert {r["temperature"] for r in transport.requests} == {llm.config.temperature, 0.0}
+
+def test_cache_hits_skip_the_transport():
+    transport = FakeTransport()
+
+    async def run():
+        llm = AsyncLLMClient(LLMConfig(), client=transport, cache=ResponseCache())
+        first = await llm.complete("prompt", prefix="article")
+        second = await llm.complete("prompt", prefix="article")
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first == second
+    assert len(transport.requests) == 1
@@ -0,0 +1,82 @@
+from dataclasses import replace
+from types import SimpleNamespace
+
+import pytest
+
+from gen_fix_cycle import cache as cache_module
+from gen_fix_cycle.cache import ResponseCache, cache_key
+from gen_fix_cycle.config import LLMConfig
+from gen_fix_cycle.llm import LLMClient
+
+from fake_llm import FakeMessages
+
+GOOD = '{"score": 1, "rationale": "r", "feedback": "f"}'
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module, "time", SimpleNamespace(time=lambda: now[0]))
+    return now
+
+def test_key_changes_with_every_input():
+    config = LLMConfig()
+    base = cache_key(config, "system", "prompt", "prefix")
+    assert cache_key(config, "system", "prompt", "prefix") == base
+    assert len({
+        base,
+        cache_key(replace(config, temperature=config.temperature + 0.5), "system", "prompt", "prefix"),
+        cache_key(replace(config, model=config.model + "-x"), "system", "prompt", "prefix"),
+        cache_key(config, "other", "prompt", "prefix"),
+        cache_key(config, "system", "other", "prefix"),
+        cache_key(config, "system", "prompt", "other"),
+    }) == 6
+
+def test_entries_expire_after_ttl(clock, tmp_path):
+    cache = ResponseCache(str(tmp_path / "c.db"), ttl=10)
+    cache.put("k", {"a": 1})
+    clock[0] += 5
+    assert cache.get("k") == {"a": 1}
+    clock[0] += 10
+    assert cache.get("k") is None
+    assert ResponseCache(str(tmp_path / "c.db"), ttl=10).get("k") is None
+
+def test_memory_tier_keeps_the_most_recently_used():
+    cache = ResponseCache(max_entries=2)
+    cache.put("a", {"v": "a"})
+    cache.put("b", {"v": "b"})
+    cache.get("a")
+    cache.put("c", {"v": "c"})
+    assert cache.get("b") is None
+    assert cache.get("a") == {"v": "a"}
+    assert cache.stats.evictions == 1
+
+def test_disk_cap_keeps_entries_hot_in_memory(clock, tmp_path):
+    path = str(tmp_path / "c.db")
+    cache = ResponseCache(path, max_disk_entries=2)
+    cache.put("hot", {"v": 1})
+    clock[0] += 1
+    cache.put("cold", {"v": 2})
+    clock[0] += 1
+    assert cache.get("hot") == {"v": 1}
+    clock[0] += 1
+    cache.put("new", {"v": 3})
+
+    reopened = ResponseCache(path)
+    assert reopened.get("hot") == {"v": 1}
+    assert reopened.get("cold") is None
+    assert reopened.get("new") == {"v": 3}
+
+def test_disk_tier_survives_restart(tmp_path):
+    path = str(tmp_path / "c.db")
+    ResponseCache(path).put("k", {"v": 1})
+    cache = ResponseCache(path)
+    assert cache.get("k") == {"v": 1}
+    assert (cache.stats.hits, cache.stats.disk_hits) == (1, 1)
+
+def test_cache_hit_makes_no_client_call():
+    client = FakeMessages(GOOD)
+    llm = LLMClient(LLMConfig(), client=client, cache=ResponseCache())
+    first = llm.complete("p", prefix="article")
+    assert llm.complete("p", prefix="article") == first
+    assert len(client.requests) == 1
+    assert llm.cache.snapshot()["hits"] == 1
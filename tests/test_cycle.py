@@ -0,0 +1,26 @@
+from gen_fix_cycle.cycle import CycleConfig, GenerationCycleManager
+from gen_fix_cycle.prompts.qc import CHECK_INPUTS
+
+from fake_llm import QUESTION, FakeLLM
+
+def unclear(check, prompt):
+    return check == "clarity" and f"Question: {QUESTION['text']}\n" in prompt
+
+def test_fixed_cycle_reports_last_round_scores():
+    manager = GenerationCycleManager(CycleConfig(course="APUSH", article="An article.", lint=False), FakeLLM(fails=unclear))
+
+    cycle = manager.run_cycle()
+
+    assert cycle.status == "complete"
+    assert not cycle.needs_revision()
+    assert all(result.score == 1 for result in cycle.qc_results)
+    assert [r.check_type for r in cycle.history[0].qc_results if r.score == 0] == ["clarity"]
+    assert cycle.final_question.text == "Analyze why X happened?"
+
+def test_stem_fix_rechecks_every_check_reading_the_stem():
+    manager = GenerationCycleManager(CycleConfig(course="APUSH", article="An article.", lint=False), FakeLLM(fails=unclear))
+
+    cycle = manager.run_cycle()
+
+    assert sorted(cycle.history[1].checked) == sorted(n for n, inputs in CHECK_INPUTS.items() if "text" in inputs)
+    assert all("text" in inputs and "responses" in inputs for inputs in CHECK_INPUTS.values())
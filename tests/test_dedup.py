@@ -0,0 +1,32 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from gen_fix_cycle.cycle import CycleConfig, GenerationCycleManager
+from gen_fix_cycle.dedup import DedupIndex
+from gen_fix_cycle.models import Difficulty, Question, QuestionType, Response
+
+from fake_llm import QUESTION, FakeLLM
+
+def question(text):
+    return Question(text, [Response("Because of A", True)], QuestionType.MCQ, Difficulty.ANALYZE)
+
+def test_add_if_unique_admits_one_of_concurrent_duplicates():
+    index = DedupIndex()
+    q = question("Analyze why the railroad expansion changed grain markets in the west?")
+    with ThreadPoolExecutor(8) as pool:
+        admitted = list(pool.map(lambda i: index.add_if_unique(f"k{i}", q), range(8)))
+    assert admitted.count(True) == 1
+    assert len(index) == 1
+    assert index.add_if_unique("k-other", question("Explain how tariffs shaped the early textile mills?"))
+
+def test_cycle_indexes_generated_and_final_questions():
+    index = DedupIndex()
+    unclear = lambda check, prompt: check == "clarity" and f"Question: {QUESTION['text']}\n" in prompt
+    config = CycleConfig(course="APUSH", article="An article.", lint=False, cycle_id="c1")
+
+    cycle = GenerationCycleManager(config, FakeLLM(fails=unclear), dedup=index).run_cycle()
+
+    assert cycle.status == "complete"
+    assert len(index) == 2
+    assert index.similar(None, 5, group=GenerationCycleManager(config, FakeLLM()).article_key) == [
+        "Analyze why X happened?", "Analyze why X?"
+    ]
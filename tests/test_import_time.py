@@ -0,0 +1,9 @@
+import pytest
+
+from benchmarks.import_time import BUDGET_MS, DEFERRED, PACKAGES, import_times
+
+@pytest.mark.parametrize("package", PACKAGES)
+def test_package_imports_within_budget_without_sdks(package):
+    times = import_times(package)
+    assert times[package] / 1000 <= BUDGET_MS
+    assert [name for name in DEFERRED if name in times] == []
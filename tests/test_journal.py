@@ -0,0 +1,54 @@
+import json
+import time
+
+import pytest
+
+from gen_fix_cycle.cycle import CycleConfig, GenerationCycleManager
+from gen_fix_cycle.journal import CycleJournal
+
+from fake_llm import FakeLLM
+
+def lines(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+def test_partial_last_line_is_truncated_on_reopen(tmp_path):
+    path = str(tmp_path / "journal.jsonl")
+    with CycleJournal(path) as journal:
+        journal.record("c1", "question", {"text": "q"})
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"cycle_id": "c1", "stage": "qc:cla')
+
+    with CycleJournal(path) as journal:
+        assert journal.stages("c1") == {"question": {"text": "q"}}
+        journal.record("c1", "status", "complete")
+    assert [record["stage"] for record in lines(path)] == ["question", "status"]
+
+def test_quiet_journal_is_flushed_by_the_timer(tmp_path):
+    path = str(tmp_path / "journal.jsonl")
+    journal = CycleJournal(path, flush_every=100, flush_interval=0.05)
+    journal.record("c1", "question", {"text": "q"})
+    time.sleep(0.3)
+    assert len(lines(path)) == 1
+    journal.close()
+
+class FailingLLM(FakeLLM):
+    def complete(self, prompt, prefix=None, schema=None):
+        if "evaluate this question's difficulty" in prompt:
+            time.sleep(0.05)
+            raise ConnectionError("dropped")
+        return super().complete(prompt, prefix, schema)
+
+def test_resume_reruns_only_checks_that_did_not_finish(tmp_path):
+    path = str(tmp_path / "journal.jsonl")
+    config = CycleConfig(course="APUSH", article="An article.", lint=False, cycle_id="c1")
+    with CycleJournal(path) as journal:
+        with pytest.raises(ConnectionError):
+            GenerationCycleManager(config, FailingLLM(), journal).run_cycle()
+
+    llm = FakeLLM()
+    with CycleJournal(path) as journal:
+        cycle = GenerationCycleManager(config, llm, journal).run_cycle()
+
+    assert cycle.status == "complete"
+    assert llm.calls == ["difficulty"]
@@ -0,0 +1,44 @@
+import pytest
+
+from gen_fix_cycle.json_extract import JSONStreamParser, extract_json, read_json_stream, validate_schema
+from gen_fix_cycle.models import ResponseSchemas
+
+def test_extract_json_ignores_fences_prose_and_placeholders():
+    text = 'Use the {question} slot.\n```json\n{"score": 1, "rationale": "a {b} c"}\n```\nDone.'
+    assert extract_json(text) == {"score": 1, "rationale": "a {b} c"}
+
+def test_extract_json_without_an_object_raises():
+    with pytest.raises(ValueError):
+        extract_json("no json {here")
+
+def test_validate_schema_reports_missing_and_mistyped_fields():
+    assert validate_schema({"score": 1, "rationale": "r", "feedback": "f"}, ResponseSchemas.BASIC) == []
+    assert validate_schema({"score": 1}, ResponseSchemas.BASIC) == ["$.rationale is missing", "$.feedback is missing"]
+    assert validate_schema({"questions": {}}, {"questions": [{"text": ""}]}) == ["$.questions should be a list"]
+    assert validate_schema({"questions": [{}]}, {"questions": [{"text": ""}]}) == ["$.questions[0].text is missing"]
+
+def test_stream_parser_completes_across_chunks_and_skips_placeholders():
+    parser = JSONStreamParser()
+    assert parser.feed("Scoring {clarity} now: ") == "pending"
+    assert parser.feed('{"score": 0, "rat') == "pending"
+    assert parser.feed('ionale": "x"} trailing') == "complete"
+    assert parser.result == {"score": 0, "rationale": "x"}
+
+def test_stream_parser_rejects_long_preamble_and_bare_words():
+    assert JSONStreamParser(max_preamble=10).feed("x" * 11) == "invalid"
+    assert JSONStreamParser().feed('{"score": maybe}') == "invalid"
+
+def test_read_json_stream_stops_early_and_flags_aborts():
+    consumed = []
+
+    def chunks(parts):
+        for part in parts:
+            consumed.append(part)
+            yield part
+
+    data, text, aborted = read_json_stream(chunks(['{"a": 1}', " more"]))
+    assert (data, text, aborted) == ({"a": 1}, '{"a": 1}', False)
+    assert consumed == ['{"a": 1}']
+
+    data, text, aborted = read_json_stream(chunks(['{"a": oops', '"rest"}']))
+    assert data is None and aborted
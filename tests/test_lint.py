@@ -0,0 +1,39 @@
+import pytest
+
+from gen_fix_cycle.lint import BLOOM_VERB_RE, QuestionLinter
+from gen_fix_cycle.models import Difficulty, Question, QuestionType, Response
+
+def question(text, options=("Rising tariffs", "Falling wages", "New canals", "Cheap land")):
+    responses = [Response(t, i == 0) for i, t in enumerate(options)]
+    return Question(text, responses, QuestionType.MCQ, Difficulty.ANALYZE)
+
+@pytest.mark.parametrize("stem", [
+    "Which statement best justifies the policy?",
+    "The author identifies which cause?",
+    "Which principle applies to the case?",
+    "How does the model classify the data?",
+    "Which factor classified the region?",
+    "The planners planned which route?",
+    "Which source is analyzed below?",
+    "Evaluating the evidence, which claim holds?",
+    "Which trend compares the regions?"
+])
+def test_inflected_bloom_verbs_are_recognized(stem):
+    assert BLOOM_VERB_RE.search(stem)
+
+def test_stem_without_a_bloom_verb_fails_clarity():
+    failures = QuestionLinter().lint(question("Which of these happened in 1850?"))
+    assert [f.check_type for f in failures] == ["clarity"]
+
+def test_clean_question_passes():
+    assert QuestionLinter().lint(question("Which statement best justifies the tariff?")) == []
+
+def test_option_rules_fail_format():
+    linter = QuestionLinter()
+    assert [f.check_type for f in linter.lint(question("Explain why?", ("A", "B")))] == ["format"]
+    duplicated = ("Rising tariffs", "Rising tariffs.", "New canals", "Cheap land")
+    assert "identical" in linter.lint(question("Explain why?", duplicated))[0].rationale
+    absolute = ("Rising tariffs", "Always wages", "New canals", "Cheap land")
+    assert "always" in linter.lint(question("Explain why?", absolute))[0].rationale
+    lopsided = ("Rising tariffs on imported cloth and iron goods", "Wages", "Canals", "Land")
+    assert "length" in linter.lint(question("Explain why?", lopsided))[0].rationale
@@ -0,0 +1,75 @@
+from types import SimpleNamespace
+
+import pytest
+
+from gen_fix_cycle.config import LLMConfig
+from gen_fix_cycle.llm import LLMClient, request_params
+from gen_fix_cycle.llm_prompts import SYSTEM_PROMPT
+from gen_fix_cycle.models import ResponseSchemas
+
+from fake_llm import FakeMessages
+
+GOOD = '{"score": 0, "rationale": "Stem is ambiguous", "feedback": "Name the period"}'
+
+def test_fenced_reply_is_parsed_without_a_repair():
+    client = FakeMessages("Here you go:\n```json\n" + GOOD + "\n```")
+    llm = LLMClient(LLMConfig(), client=client)
+    assert llm.complete("p", schema=ResponseSchemas.BASIC)["feedback"] == "Name the period"
+    assert len(client.requests) == 1
+
+def test_schema_mismatch_sends_a_repair_prompt():
+    client = FakeMessages('{"score": 0}', GOOD)
+    llm = LLMClient(LLMConfig(), client=client)
+    assert llm.complete("p", schema=ResponseSchemas.BASIC)["rationale"] == "Stem is ambiguous"
+    repair = client.requests[1]["messages"][0]["content"]
+    assert '{"score": 0}' in repair and "rationale" in repair
+
+def test_unrepairable_reply_raises():
+    llm = LLMClient(LLMConfig(), client=FakeMessages("nothing", "still nothing"))
+    with pytest.raises(ValueError):
+        llm.complete("p", schema=ResponseSchemas.BASIC)
+
+def test_stream_mode_parses_as_it_arrives():
+    client = FakeMessages(GOOD + " and some trailing prose")
+    llm = LLMClient(LLMConfig(), client=client, stream=True)
+    assert llm.complete("p", schema=ResponseSchemas.BASIC)["score"] == 0
+    assert [r["stream"] for r in client.requests] == [True]
+
+def test_aborted_stream_is_re_requested_in_full_not_repaired():
+    malformed = '{"score": 0, "rationale": \'Stem is ambiguous\', "feedback": "Name the period"}'
+    client = FakeMessages(malformed, GOOD)
+    llm = LLMClient(LLMConfig(), client=client, stream=True)
+    assert llm.complete("p", schema=ResponseSchemas.BASIC)["feedback"] == "Name the period"
+    assert [r["stream"] for r in client.requests] == [True, False]
+    assert client.requests[0]["messages"] == client.requests[1]["messages"]
+
+def test_aborted_stream_repairs_the_full_reply():
+    malformed = '{"score": 0, "rationale": \'Stem is ambiguous\', "feedback": "Name the period"}'
+    client = FakeMessages(malformed, malformed, GOOD)
+    llm = LLMClient(LLMConfig(), client=client, stream=True)
+    assert llm.complete("p", schema=ResponseSchemas.BASIC)["score"] == 0
+    assert malformed in client.requests[2]["messages"][0]["content"]
+
+def test_prefix_is_a_cached_block_ahead_of_the_prompt():
+    params = request_params(LLMConfig(), "per-question part", "shared article")
+    assert params["system"] == SYSTEM_PROMPT
+    first, second = params["messages"][0]["content"]
+    assert first == {"type": "text", "text": "shared article", "cache_control": {"type": "ephemeral"}}
+    assert second == {"type": "text", "text": "per-question part"}
+    assert request_params(LLMConfig(), "only prompt")["messages"][0]["content"] == "only prompt"
+
+def test_usage_counts_prompt_cache_reads_and_writes():
+    usage = [
+        SimpleNamespace(input_tokens=20, output_tokens=5, cache_creation_input_tokens=1000, cache_read_input_tokens=0),
+        SimpleNamespace(input_tokens=20, output_tokens=5, cache_creation_input_tokens=0, cache_read_input_tokens=1000),
+    ]
+    llm = LLMClient(LLMConfig(), client=FakeMessages(GOOD, GOOD, usage=usage))
+
+    llm.complete("first", prefix="shared article")
+    llm.complete("second", prefix="shared article")
+
+    snapshot = llm.usage.snapshot()
+    assert snapshot["requests"] == 2
+    assert snapshot["cache_creation_input_tokens"] == 1000
+    assert snapshot["cache_read_input_tokens"] == 1000
+    assert snapshot["input_tokens"] == 40
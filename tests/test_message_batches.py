@@ -0,0 +1,89 @@
+from types import SimpleNamespace
+import threading
+
+import pytest
+
+from gen_fix_cycle.message_batches import MessageBatchTransport
+
+class FakeBatches:
+    """Batch service that ends a batch on its second status check."""
+
+    def __init__(self, extra_ids=(), fail_after=None):
+        self.created = {}
+        self.checks = {}
+        self.extra_ids = extra_ids
+        self.fail_after = fail_after
+
+    def create(self, requests):
+        batch_id = f"batch-{len(self.created)}"
+        self.created[batch_id] = requests
+        self.checks[batch_id] = 0
+        return SimpleNamespace(id=batch_id)
+
+    def retrieve(self, batch_id):
+        self.checks[batch_id] += 1
+        return SimpleNamespace(processing_status="ended" if self.checks[batch_id] > 1 else "in_progress")
+
+    def results(self, batch_id):
+        for custom_id in self.extra_ids:
+            yield SimpleNamespace(custom_id=custom_id, result=SimpleNamespace(type="succeeded", message="?"))
+        for i, request in enumerate(self.created[batch_id]):
+            if i == self.fail_after:
+                raise ConnectionError("results stream dropped")
+            prompt = request["params"]["messages"][0]["content"]
+            result = (
+                SimpleNamespace(type="errored")
+                if prompt == "fail" else
+                SimpleNamespace(type="succeeded", message=f"echo {prompt}")
+            )
+            yield SimpleNamespace(custom_id=request["custom_id"], result=result)
+
+def transport(**options):
+    batches = FakeBatches(**options)
+    client = SimpleNamespace(messages=SimpleNamespace(batches=batches))
+    return MessageBatchTransport(client, max_batch_size=3, max_wait=0.05, poll_interval=0.01), batches
+
+def send_all(backend, prompts):
+    out = {}
+    threads = [threading.Thread(target=send, args=(backend, p, out)) for p in prompts]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    assert not any(thread.is_alive() for thread in threads)
+    return out
+
+def send(backend, prompt, out):
+    try:
+        out[prompt] = backend.create(messages=[{"role": "user", "content": prompt}])
+    except RuntimeError as e:
+        out[prompt] = e
+
+def test_requests_are_batched_polled_and_failures_raised():
+    backend, batches = transport()
+    out = send_all(backend, ("a", "b", "fail"))
+
+    assert out["a"] == "echo a" and out["b"] == "echo b"
+    assert isinstance(out["fail"], RuntimeError)
+    assert list(batches.created) == ["batch-0"]
+    assert batches.checks["batch-0"] == 2
+    assert (backend.stats.batches_submitted, backend.stats.requests_submitted, backend.stats.requests_failed) == (1, 3, 1)
+
+def test_streaming_requests_are_rejected():
+    backend, batches = transport()
+    with pytest.raises(ValueError):
+        backend.create(stream=True, messages=[])
+    assert batches.created == {}
+
+def test_a_failed_results_read_fails_the_unread_requests():
+    backend, _ = transport(fail_after=1)
+    out = send_all(backend, ("a", "b", "c"))
+
+    assert sum(isinstance(value, str) for value in out.values()) == 1
+    assert sum(isinstance(value, RuntimeError) for value in out.values()) == 2
+    assert backend._in_flight == {}
+
+def test_unknown_result_ids_are_ignored():
+    backend, _ = transport(extra_ids=("req-unknown",))
+    out = send_all(backend, ("a", "b", "c"))
+    assert sorted(out.values()) == ["echo a", "echo b", "echo c"]
@@ -0,0 +1,38 @@
+from string import Template
+
+from gen_fix_cycle.llm_prompts import generation_prompt, repair_prompt
+from gen_fix_cycle.prompts.criteria import get_examples
+from gen_fix_cycle.prompts.registry import PROMPTS, CompiledTemplate
+
+def test_compiled_template_matches_substitute():
+    template = Template("Q: ${question} costs $$5 {not a field} $responses")
+    values = {"question": "why {x}?", "responses": "a, b"}
+    assert CompiledTemplate.compile(template).render(**values) == template.substitute(values)
+
+def test_client_prompts_render_through_registry():
+    assert PROMPTS.get("client.generation").placeholders == {"ek_codes", "lo_codes", "difficulty", "existing"}
+    assert "N/A and LO1" in generation_prompt(None, "LO1", "3")
+    assert "not similar to: q1" in generation_prompt("EK1", "LO1", "3", "q1")
+    assert repair_prompt("{bad", None).rstrip().endswith("{bad")
+
+def test_examples_are_immutable():
+    assert isinstance(get_examples("soc", "good"), tuple)
+    assert get_examples("unknown", "good") == ()
+
+def test_segments_join_to_the_rendered_prompt():
+    values = {"question": "Why {x}?", "responses": "1. A"}
+    segments = PROMPTS.segments("qc.clarity", **values)
+    assert "".join(segments) == PROMPTS.render("qc.clarity", **values)
+    assert "Why {x}?" in segments and "1. A" in segments
+
+def test_segments_keep_bound_criteria_static():
+    segments = PROMPTS.segments("gen.mcq_prefix", "soc", article="ARTICLE")
+    assert segments.count("ARTICLE") == 1
+    assert len(segments) == 3
+
+def test_assemble_splits_prefix_from_prompt():
+    values = dict(article="ARTICLE", ek_codes="EK1", lo_codes="LO1", difficulty="3", existing="")
+    prefix, prompt = PROMPTS.assemble("gen.mcq_prefix", "gen.mcq", "soc", **values)
+    assert prefix == PROMPTS.render("gen.mcq_prefix", "soc", article="ARTICLE")
+    assert prompt == PROMPTS.render("gen.mcq", **values)
+    assert PROMPTS.assemble("gen.mcq_prefix", "gen.mcq", "soc", **dict(values, ek_codes="EK2"))[0] == prefix
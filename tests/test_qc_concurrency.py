@@ -0,0 +1,33 @@
+import time
+
+from gen_fix_cycle.models import Difficulty, Question, QuestionType, Response
+from gen_fix_cycle.prompts.qc import QualityChecker
+
+from fake_llm import FakeLLM
+
+DELAYS = {"clarity": 0.2, "format": 0.05, "content": 0.1, "difficulty": 0.15}
+
+QUESTION = Question(
+    text="Analyze why X?",
+    responses=[Response("Because of A", True), Response("Because of C", False)],
+    question_type=QuestionType.MCQ,
+    difficulty=Difficulty.ANALYZE
+)
+
+def run(max_concurrency):
+    checker = QualityChecker(FakeLLM(delays=DELAYS), max_concurrency=max_concurrency)
+    start = time.perf_counter()
+    results = checker.run_all_checks(QUESTION, "An article.")
+    return results, time.perf_counter() - start
+
+def test_concurrent_checks_keep_order():
+    results, _ = run(4)
+    assert [r.check_type for r in results] == ["clarity", "format", "content", "difficulty"]
+
+def test_concurrent_checks_take_about_the_slowest_check():
+    _, elapsed = run(4)
+    assert max(DELAYS.values()) <= elapsed < max(DELAYS.values()) + 0.1
+
+def test_single_worker_runs_checks_back_to_back():
+    _, elapsed = run(1)
+    assert elapsed >= sum(DELAYS.values())
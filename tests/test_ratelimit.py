@@ -0,0 +1,66 @@
+from types import SimpleNamespace
+import time
+
+import pytest
+
+from gen_fix_cycle.concurrency import AdaptiveConcurrency
+from gen_fix_cycle.ratelimit import RateLimiter
+
+class APIStatusError(Exception):
+    def __init__(self, status_code, retry_after=None):
+        super().__init__(f"status {status_code}")
+        self.status_code = status_code
+        headers = {"retry-after": retry_after} if retry_after else {}
+        self.response = SimpleNamespace(headers=headers)
+
+class FakeClient:
+    """Raises the queued errors in turn, then succeeds."""
+
+    def __init__(self, *errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def send(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return "ok"
+
+def test_throttling_is_retried_and_shrinks_the_limit():
+    concurrency = AdaptiveConcurrency(initial=8)
+    limiter = RateLimiter(base_delay=0.01, concurrency=concurrency)
+    client = FakeClient(APIStatusError(429), APIStatusError(529), APIStatusError(503))
+
+    assert limiter.call(client.send) == "ok"
+
+    assert client.calls == 4
+    assert concurrency.limit < 8 / 2
+    assert (limiter.stats.requests, limiter.stats.retries, limiter.stats.throttled) == (4, 3, 2)
+
+def test_retry_after_header_sets_the_delay():
+    limiter = RateLimiter(base_delay=0.0)
+    client = FakeClient(APIStatusError(429, retry_after="0.2"))
+
+    start = time.monotonic()
+    limiter.call(client.send)
+
+    assert time.monotonic() - start >= 0.2
+    assert limiter.stats.throttle_seconds == pytest.approx(0.2)
+
+def test_non_retryable_errors_and_exhausted_retries_raise():
+    limiter = RateLimiter(max_retries=1, base_delay=0.0)
+    with pytest.raises(APIStatusError):
+        limiter.call(FakeClient(APIStatusError(400)).send)
+    with pytest.raises(APIStatusError):
+        limiter.call(FakeClient(APIStatusError(500), APIStatusError(500)).send)
+    assert limiter.stats.retries == 1
+
+def test_requests_larger_than_the_bucket_are_charged_in_full():
+    # 1000 tokens/s with a 50-token bucket: 600 tokens need about 0.55 s
+    limiter = RateLimiter(tokens_per_minute=60000, burst_seconds=0.05)
+
+    start = time.monotonic()
+    for _ in range(6):
+        limiter.call(lambda: None, tokens=100)
+
+    assert time.monotonic() - start >= 0.5
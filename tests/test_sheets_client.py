@@ -0,0 +1,15 @@
+from sheets import GoogleSheetsClient, SheetsReadCache
+
+from fake_sheets import FakeSheetsService
+
+def test_iter_rows_reads_in_windows_and_bypasses_cache():
+    service = FakeSheetsService()
+    service.set("S", [[str(i)] for i in range(5)])
+    cache = SheetsReadCache(validate=False)
+    client = GoogleSheetsClient(service=service, cache=cache)
+
+    rows = list(client.iter_rows("s", "S", chunk_rows=2))
+
+    assert rows == [[str(i)] for i in range(5)]
+    assert [call[1] for call in service.calls] == ["'S'!1:2", "'S'!3:4", "'S'!5:6", "'S'!7:8"]
+    assert cache.snapshot() == {"hits": 0, "validated_hits": 0, "misses": 0}
@@ -0,0 +1,32 @@
+from sheets import GoogleSheetsClient, SheetRange, SheetWriteRequest
+from sheets.diff import coalesce
+
+from fake_sheets import FakeSheetsService
+
+def test_coalesce_keeps_rectangles_on_non_adjacent_rows():
+    assert sorted(coalesce({(0, 0), (2, 0)})) == [(0, 0, 0, 0), (2, 0, 2, 0)]
+
+def test_coalesce_merges_adjacent_rows_with_same_span():
+    assert sorted(coalesce({(0, 1), (0, 2), (1, 1), (1, 2), (3, 1)})) == [(0, 1, 1, 2), (3, 1, 3, 1)]
+
+def test_write_diff_sends_every_changed_cell():
+    service = FakeSheetsService()
+    service.set("S", [["a"], ["b"], ["c"]])
+    client = GoogleSheetsClient(service=service)
+
+    response = client.write_diff(SheetWriteRequest("s", SheetRange("S", "A1"), [["X"], ["b"], ["Z"]]))
+
+    assert service.calls[-1] == ("batchUpdate", ["'S'!A1:A1", "'S'!A3:A3"])
+    assert response.updated_cells == 2
+    assert response.requested_cells == 3
+    assert service._read("'S'!A1:A3") == [["X"], ["b"], ["Z"]]
+
+def test_write_diff_skips_unchanged_ranges():
+    service = FakeSheetsService()
+    service.set("S", [["a", "b"]])
+    client = GoogleSheetsClient(service=service)
+
+    response = client.write_diff(SheetWriteRequest("s", SheetRange("S", "A1"), [["a", "b"]]))
+
+    assert response.updated_cells == 0
+    assert [call[0] for call in service.calls] == ["get"]
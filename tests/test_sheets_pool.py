@@ -0,0 +1,39 @@
+import threading
+
+import pytest
+
+from sheets import GoogleSheetsClientPool, SheetRange, SheetReadRequest
+
+from fake_sheets import FakeSheetsService
+
+def test_read_many_reuses_worker_clients_across_calls():
+    built = []
+
+    def factory(api, version):
+        service = FakeSheetsService()
+        service.set("S", [[threading.current_thread().name]])
+        built.append(service)
+        return service
+
+    requests = [SheetReadRequest(f"id{i}", SheetRange("S", "A1")) for i in range(4)]
+    with GoogleSheetsClientPool(max_workers=2, service_factory=factory) as pool:
+        first = pool.read_many(requests)
+        second = pool.read_many(requests)
+
+    assert len(first) == len(second) == 4
+    assert len(built) <= 2
+    with pytest.raises(ValueError):
+        pool.read_many(requests)
+
+def test_read_many_keeps_request_order():
+    service = FakeSheetsService()
+    service.set("A", [["a"]])
+    service.set("B", [["b"]])
+    requests = [
+        SheetReadRequest("x", SheetRange("A", "A1")),
+        SheetReadRequest("y", SheetRange("B", "A1")),
+        SheetReadRequest("x", SheetRange("B", "A1")),
+    ]
+    with GoogleSheetsClientPool(service_factory=lambda api, version: service) as pool:
+        responses = pool.read_many(requests)
+    assert [r.values for r in responses] == [[["a"]], [["b"]], [["b"]]]
@@ -0,0 +1,35 @@
+import pytest
+
+from gen_fix_cycle.models import Difficulty, GenerationCycle, QCResult, Question, QuestionType, Response
+from sheets import GoogleSheetsClient, SheetsResultSink
+from sheets.sink import COLUMNS, cycle_row
+
+from fake_sheets import FakeSheetsService
+
+def make_cycle(cycle_id):
+    question = Question(
+        text="Analyze why X?",
+        responses=[Response("A", True), Response("B", False), Response("C", False)],
+        question_type=QuestionType.MCQ,
+        difficulty=Difficulty.ANALYZE
+    )
+    results = [QCResult(1, "r", "", check_type="clarity"), QCResult(0, "r", "fix it", check_type="format")]
+    return GenerationCycle(question, results, status="needs_revision", cycle_id=cycle_id)
+
+def test_cycle_row_is_all_strings():
+    row = cycle_row(make_cycle("c1"))
+    assert len(row) == len(COLUMNS)
+    assert all(isinstance(value, str) for value in row)
+    assert row[COLUMNS.index("difficulty")] == "ANALYZE"
+    assert row[COLUMNS.index("qc_scores")] == "clarity:1 format:0"
+
+def test_sink_batches_rows_and_rejects_adds_after_close():
+    service = FakeSheetsService()
+    sink = SheetsResultSink(GoogleSheetsClient(service=service), "s", "Results", flush_rows=2, flush_interval=60)
+    with sink:
+        for i in range(3):
+            sink.add(make_cycle(f"c{i}"))
+    assert sink.rows_written == 3
+    assert sum(call[1] for call in service.calls if call[0] == "append") == 3
+    with pytest.raises(ValueError):
+        sink.add(make_cycle("late"))